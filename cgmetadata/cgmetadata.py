@@ -5,28 +5,156 @@ and uses Apple's native ImageIO APIs. It should be able to read metadata from an
 by ImageIO.
 
 Implementation Note: Core Foundation objects created with Create or Copy functions must be released;
-this is done with `del Object` in pyobjc.
+PyObjC handles this automatically when the proxy object goes out of scope and the enclosing
+`objc.autorelease_pool()` context drains.
 """
 
 from __future__ import annotations
 
-from typing import Any
+import concurrent.futures
+import functools
+import os
+import weakref
+from types import MappingProxyType
+from typing import Any, Callable, Iterable, Mapping
 
 import objc
 import Quartz
-from AVFoundation import AVURLAsset
+from AVFoundation import AVMetadataFormatQuickTimeUserData, AVURLAsset
 from CoreFoundation import CFDictionaryCreate, CFDictionaryRef
 from Foundation import NSURL
 
 from .constants import MDTA, UDTA, XMP
 from .iso6709 import parse_iso_6709
 from .metadata import (
+    _NO_CACHE_OPTIONS,
+    LazyMetadataDict,
     NSDictionary_to_dict_recursive,
     metadata_dictionary_from_image_metadata_ref,
 )
-from .types import FilePath
+from .types import CGMutableImageMetadataRef, FilePath
 from .xmp import is_xmp_packet, metadata_dictionary_from_xmp_packet
 
+# immutable empty properties dictionary returned for images with no metadata;
+# created once so the miss path doesn't allocate a CF object per call
+_EMPTY_PROPERTIES = CFDictionaryCreate(None, [], [], 0, None, None)
+
+# GPS property keys, bound once at import to avoid repeated attribute lookups
+# through the Quartz module on the hot path
+_GPS_DICT = Quartz.kCGImagePropertyGPSDictionary
+_GPS_LATITUDE = Quartz.kCGImagePropertyGPSLatitude
+_GPS_LATITUDE_REF = Quartz.kCGImagePropertyGPSLatitudeRef
+_GPS_LONGITUDE = Quartz.kCGImagePropertyGPSLongitude
+_GPS_LONGITUDE_REF = Quartz.kCGImagePropertyGPSLongitudeRef
+
+
+def _fspath(path: FilePath) -> str:
+    """Return the filesystem path for path as a str.
+
+    os.fspath is implemented in C and is cheaper than str() for pathlib.Path
+    objects; it also raises TypeError early for values that are not paths.
+    """
+    return os.fspath(path)
+
+
+def _nsurl_for(image_path: FilePath | NSURL) -> NSURL:
+    """Return an NSURL for the given path; passes through a value that is already an NSURL.
+
+    Args:
+        image_path: Path to a file or an NSURL.
+
+    Returns:
+        An NSURL for the file.
+
+    Note:
+        Converting a path to an NSURL is pure overhead when repeated for the
+        same file; callers that chain several loaders can convert once and
+        pass the NSURL through.
+    """
+    if isinstance(image_path, NSURL):
+        return image_path
+    # isDirectory:False skips the stat fileURLWithPath: performs to decide
+    # whether to append a trailing slash; the paths here are always files
+    return NSURL.fileURLWithPath_isDirectory_(_fspath(image_path), False)
+
+
+def _open_image_source(image_path: FilePath | NSURL) -> Quartz.CGImageSourceRef:
+    """Create a CGImageSourceRef for the image at the given path.
+
+    Args:
+        image_path: Path to the image file or an NSURL for the file.
+
+    Returns:
+        A CGImageSourceRef for the image file.
+
+    Note:
+        Must be called from within an objc.autorelease_pool() context.
+    """
+    return Quartz.CGImageSourceCreateWithURL(_nsurl_for(image_path), _NO_CACHE_OPTIONS)
+
+
+class ImageSource:
+    """Context manager wrapping a CGImageSource for repeated metadata reads.
+
+    Opens the image once and memoizes the properties dictionary and the XMP
+    metadata ref so that reading several kinds of metadata from the same file
+    only parses the image header a single time.
+
+    Args:
+        image_path: Path to the image file.
+
+    Example:
+        with ImageSource(image_path) as source:
+            properties = source.properties
+            latitude, longitude = source.location()
+    """
+
+    def __init__(self, image_path: FilePath):
+        self.image_path = image_path
+        # the pool drains the NSURL created while opening; the CGImageSource
+        # itself is Create-owned so it safely outlives the pool
+        with objc.autorelease_pool():
+            self._source = _open_image_source(image_path)
+        self._properties = None
+        self._metadata_ref = None
+
+    @property
+    def properties(self) -> CFDictionaryRef:
+        """The properties CFDictionary for the image, as returned by load_image_properties."""
+        if self._properties is None:
+            with objc.autorelease_pool():
+                self._properties = (
+                    Quartz.CGImageSourceCopyPropertiesAtIndex(
+                        self._source, 0, _NO_CACHE_OPTIONS
+                    )
+                    or _EMPTY_PROPERTIES
+                )
+        return self._properties
+
+    @property
+    def metadata_ref(self) -> Quartz.CGImageMetadataRef:
+        """The XMP metadata ref for the image, as returned by load_image_metadata_ref."""
+        if self._metadata_ref is None:
+            with objc.autorelease_pool():
+                self._metadata_ref = Quartz.CGImageSourceCopyMetadataAtIndex(
+                    self._source, 0, None
+                ) or Quartz.CGImageMetadataCreateMutable()
+        return self._metadata_ref
+
+    def location(self) -> tuple[float, float]:
+        """Return the GPS latitude/longitude for the image; see load_image_location."""
+        return load_image_location(self.image_path, self.properties)
+
+    def close(self):
+        """Release the underlying CGImageSource."""
+        self._source = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
 
 def load_image_properties(
     image_path: FilePath,
@@ -48,12 +176,12 @@ def load_image_properties(
         This function is useful for retrieving EXIF and IPTC metadata.
     """
     with objc.autorelease_pool():
-        image_url = NSURL.fileURLWithPath_(str(image_path))
-        image_source = Quartz.CGImageSourceCreateWithURL(image_url, None)
+        image_source = _open_image_source(image_path)
 
-        metadata = Quartz.CGImageSourceCopyPropertiesAtIndex(image_source, 0, None)
-        del image_source
-        return metadata or CFDictionaryCreate(None, [], [], 0, None, None)
+        metadata = Quartz.CGImageSourceCopyPropertiesAtIndex(
+            image_source, 0, _NO_CACHE_OPTIONS
+        )
+        return metadata or _EMPTY_PROPERTIES
 
 
 def load_image_properties_dict(
@@ -73,16 +201,90 @@ def load_image_properties_dict(
         for more information.
 
         This function is useful for retrieving EXIF and IPTC metadata.
+
+        Results are cached keyed on the file's path, size, and modification
+        time so repeated reads of an unchanged file do not re-parse the image;
+        use clear_metadata_cache() to drop the cache explicitly. Because the
+        cache hands every caller the same object, treat the returned mapping
+        as read-only; mutating it in place would corrupt the cached copy for
+        all subsequent reads of the file.
     """
+    image_path = _fspath(image_path)
+    file_stat = os.stat(image_path)
+    return _load_image_properties_dict_cached(
+        image_path, file_stat.st_size, file_stat.st_mtime_ns
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def _load_image_properties_dict_cached(
+    image_path: str, size: int, mtime_ns: int
+) -> dict[str, Any]:
+    """Load the properties dict for image_path; size and mtime_ns key the cache."""
     metadata = load_image_properties(image_path)
     return NSDictionary_to_dict_recursive(metadata)
 
 
+def clear_metadata_cache() -> None:
+    """Clear the cached image properties and XMP metadata dictionaries."""
+    _load_image_properties_dict_cached.cache_clear()
+    _load_image_metadata_dict_cached.cache_clear()
+
+
 def load_image_metadata_dict(
     image_path: FilePath,
-) -> dict[str, Any]:
+) -> LazyMetadataDict | Mapping[str, Any]:
     """Get the XMP metadata from the image at the given path
 
+    Args:
+        image_path: Path to the image file.
+
+    Returns:
+        A read-only mapping of XMP metadata properties from the image file.
+        The mapping keys are in form "prefix:name", e.g. "dc:creator".
+
+    Note:
+        Values are parsed lazily on first access so reading a single key does
+        not walk the full XMP tree; use load_image_metadata_dict_eager for a
+        plain dict with every tag parsed up front.
+
+        Results are cached keyed on the file's path, size, and modification
+        time so repeated reads of an unchanged file do not re-parse the image;
+        use clear_metadata_cache() to drop the cache explicitly. Because the
+        cache hands every caller the same object, treat the returned mapping
+        as read-only; mutating it in place would corrupt the cached copy for
+        all subsequent reads of the file.
+    """
+    image_path = _fspath(image_path)
+    file_stat = os.stat(image_path)
+    return _load_image_metadata_dict_cached(
+        image_path, file_stat.st_size, file_stat.st_mtime_ns
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def _load_image_metadata_dict_cached(
+    image_path: str, size: int, mtime_ns: int
+) -> LazyMetadataDict | Mapping[str, Any]:
+    """Load the XMP metadata mapping for image_path; size and mtime_ns key the cache.
+
+    The cached object is shared by every caller, so the XMP-less case returns
+    an immutable empty mapping rather than a plain dict that a caller could
+    mutate and thereby poison the cache.
+    """
+    metadata = load_image_metadata_ref(image_path)
+    return (
+        LazyMetadataDict(metadata)
+        if metadata is not None
+        else MappingProxyType({})
+    )
+
+
+def load_image_metadata_dict_eager(
+    image_path: FilePath,
+) -> dict[str, Any]:
+    """Get the XMP metadata from the image at the given path as a plain dict
+
     Args:
         image_path: Path to the image file.
 
@@ -96,46 +298,198 @@ def load_image_metadata_dict(
 
 def load_image_metadata_ref(
     image_path: FilePath,
-) -> Quartz.CGImageMetadataRef:
+) -> Quartz.CGImageMetadataRef | None:
     """Get the Quartz.CGImageMetadataRef from the image at the given path
 
     Args:
         image_path: Path to the image file.
 
     Returns:
-        A Quartz.CGImageMetadataRef containing the XMP metadata.
-        If the image does not contain metadata, an empty Quartz.CGImageMetadataRef is returned.
+        A Quartz.CGImageMetadataRef containing the XMP metadata or None if the
+        image does not contain XMP metadata.
+
+    Note:
+        Returning None rather than an empty mutable metadata ref avoids
+        allocating an object most callers immediately discard; use
+        metadata_ref_create_empty_mutable() if you need a ref to build on.
+    """
+    with objc.autorelease_pool():
+        image_source = _open_image_source(image_path)
+
+        return Quartz.CGImageSourceCopyMetadataAtIndex(image_source, 0, None)
+
+
+def load_image_metadata_ref_mutable(
+    image_path: FilePath,
+) -> CGMutableImageMetadataRef | None:
+    """Get a mutable copy of the XMP metadata from the image at the given path
+
+    Args:
+        image_path: Path to the image file.
+
+    Returns:
+        A CGMutableImageMetadataRef containing the XMP metadata or None if the
+        image does not contain XMP metadata.
+
+    Note:
+        Equivalent to load_image_metadata_ref followed by
+        metadata_ref_create_mutable_copy, but the immutable ref never crosses
+        back into Python and both calls share one autorelease pool.
+    """
+    with objc.autorelease_pool():
+        image_source = _open_image_source(image_path)
+
+        metadata = Quartz.CGImageSourceCopyMetadataAtIndex(image_source, 0, None)
+        if metadata is None:
+            return None
+        return Quartz.CGImageMetadataCreateMutableCopy(metadata)
+
+
+def load_image_all(
+    image_path: FilePath,
+) -> tuple[CFDictionaryRef, Quartz.CGImageMetadataRef]:
+    """Return both the properties dictionary and the XMP metadata ref for an image.
+
+    Args:
+        image_path: Path to the image file.
+
+    Returns:
+        A tuple of (properties, metadata_ref) where properties is a CFDictionary
+        of metadata properties as returned by load_image_properties and metadata_ref
+        is a Quartz.CGImageMetadataRef as returned by load_image_metadata_ref.
+
+    Note:
+        This creates the underlying CGImageSource once and reads both the
+        properties and the XMP metadata from it, which is faster than calling
+        load_image_properties and load_image_metadata_ref separately as each
+        of those must re-parse the image header.
     """
     with objc.autorelease_pool():
-        image_url = NSURL.fileURLWithPath_(str(image_path))
-        image_source = Quartz.CGImageSourceCreateWithURL(image_url, None)
+        image_source = _open_image_source(image_path)
 
+        properties = Quartz.CGImageSourceCopyPropertiesAtIndex(
+            image_source, 0, _NO_CACHE_OPTIONS
+        )
         metadata = Quartz.CGImageSourceCopyMetadataAtIndex(image_source, 0, None)
-        del image_source
-    return metadata or Quartz.CGImageMetadataCreateMutable()
+        return (
+            properties or _EMPTY_PROPERTIES,
+            metadata or Quartz.CGImageMetadataCreateMutable(),
+        )
+
+
+def load_image_properties_many(
+    image_paths: Iterable[FilePath],
+    workers: int | None = None,
+) -> list[dict[str, Any]]:
+    """Load the properties dictionaries for many images concurrently.
+
+    Args:
+        image_paths: Iterable of paths to image files.
+        workers: Number of worker threads; if None, uses the
+            concurrent.futures default based on the CPU count.
+
+    Returns:
+        A list of properties dictionaries in the same order as image_paths.
+
+    Note:
+        ImageIO releases the GIL while parsing so reads scale across threads;
+        each worker call opens its own autorelease pool, which is required as
+        autorelease pools are thread-local.
+    """
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(load_image_properties_dict, image_paths))
+
+
+def load_video_metadata_many(
+    video_paths: Iterable[FilePath],
+    workers: int | None = None,
+) -> list[dict[str, Any]]:
+    """Load the metadata dictionaries for many videos concurrently.
+
+    Args:
+        video_paths: Iterable of paths to video files.
+        workers: Number of worker threads; if None, uses the
+            concurrent.futures default based on the CPU count.
+
+    Returns:
+        A list of metadata dictionaries in the same order as video_paths.
+
+    Note:
+        AVFoundation releases the GIL while parsing so reads scale across
+        threads; each worker call opens its own autorelease pool, which is
+        required as autorelease pools are thread-local.
+    """
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(load_video_metadata, video_paths))
+
+
+def batch_load(
+    paths: Iterable[FilePath],
+    loader: Callable[[FilePath], Any],
+    drain_every: int = 64,
+) -> list[Any]:
+    """Call a loader function on each path, draining the autorelease pool periodically.
+
+    Args:
+        paths: Iterable of paths to pass to the loader.
+        loader: Function to call on each path, for example load_image_properties_dict.
+        drain_every: Number of calls between autorelease pool drains.
+
+    Returns:
+        A list of the loader results, in the same order as paths.
+
+    Note:
+        Each loader already opens its own autorelease pool which is fine for
+        one-shot use but when iterating over thousands of files the Objective-C
+        objects autoreleased by the Core Graphics calls can accumulate and grow
+        peak memory. This helper wraps batches of drain_every calls in a shared
+        pool so memory use stays bounded regardless of the number of paths.
+    """
+    results = []
+    batch = []
+    for path in paths:
+        batch.append(path)
+        if len(batch) >= drain_every:
+            with objc.autorelease_pool():
+                results.extend(loader(p) for p in batch)
+            batch = []
+    if batch:
+        with objc.autorelease_pool():
+            results.extend(loader(p) for p in batch)
+    return results
 
 
 def load_image_location(
     image_path: FilePath,
+    properties: CFDictionaryRef | dict[str, Any] | None = None,
 ) -> tuple[float, float]:
     """Return the GPS latitude/longitude coordinates from the image at the given path.
 
     Args:
         image_path: Path to the image file.
+        properties: Optional pre-loaded properties dictionary as returned by
+            load_image_properties or load_image_properties_dict;
+            if provided, the image file is not re-read.
 
     Returns:
         A tuple of latitude and longitude.
 
     Raises:
         ValueError: If the image does not contain GPS data or if the GPS data does not contain latitude and longitude.
+
+    Note:
+        Only the four GPS scalar fields are converted to Python values; the
+        rest of the properties dictionary (EXIF, IPTC, TIFF, ...) is never
+        recursively converted just to read the location.
     """
-    properties = load_image_properties_dict(image_path)
-    gps_data = properties.get(Quartz.kQuartz.CGImagePropertyGPSDictionary)
+    if properties is None:
+        properties = load_image_properties(image_path)
+    gps_data = properties.get(_GPS_DICT)
     if not gps_data:
         raise ValueError("This image does not contain GPS data")
 
-    latitude = gps_data.get(Quartz.kQuartz.CGImagePropertyGPSLatitude)
-    longitude = gps_data.get(Quartz.kQuartz.CGImagePropertyGPSLongitude)
+    latitude = gps_data.get(_GPS_LATITUDE)
+    longitude = gps_data.get(_GPS_LONGITUDE)
 
     if latitude is None or longitude is None:
         raise ValueError("Could not extract latitude and/or longitude from GPS data")
@@ -146,102 +500,186 @@ def load_image_location(
     except ValueError:
         raise ValueError("Could not extract latitude and/or longitude from GPS data")
 
-    if gps_data.get(Quartz.kQuartz.CGImagePropertyGPSLatitudeRef) == "S":
+    if gps_data.get(_GPS_LATITUDE_REF) == "S":
         latitude *= -1
-    if gps_data.get(Quartz.kQuartz.CGImagePropertyGPSLongitudeRef) == "W":
+    if gps_data.get(_GPS_LONGITUDE_REF) == "W":
         longitude *= -1
 
     return latitude, longitude
 
 
-def load_video_metadata(video_path: FilePath) -> dict[str, Any]:
-    """Load metadata from a video file using AVFoundation.
+# AVURLAssets cached weakly, keyed on (path, mtime_ns); the cache lets
+# back-to-back loads of the same video share one container parse without
+# ever keeping an asset alive on its own
+_asset_cache: weakref.WeakValueDictionary = weakref.WeakValueDictionary()
+
+
+def _get_asset(video_path: FilePath) -> AVURLAsset:
+    """Return an AVURLAsset for the video at the given path.
 
     Args:
         video_path: Path to a video file.
 
-    Returns: A dictionary of metadata key-value pairs.
+    Returns:
+        An AVURLAsset for the video file, shared with any other live caller
+        reading the same (unmodified) file.
     """
-    with objc.autorelease_pool():
-        video_path = str(video_path)
-        video_url = NSURL.fileURLWithPath_(video_path)
+    video_path = _fspath(video_path)
+    key = (video_path, os.stat(video_path).st_mtime_ns)
+    asset = _asset_cache.get(key)
+    if asset is None:
+        # isDirectory:False avoids the stat fileURLWithPath: would perform
+        video_url = NSURL.fileURLWithPath_isDirectory_(video_path, False)
         asset = AVURLAsset.URLAssetWithURL_options_(video_url, None)
+        _asset_cache[key] = asset
+    return asset
+
+
+def _video_item_fields(item: Any) -> tuple[str, str, Any]:
+    """Return the (namespace, key, value) fields from an AVMetadataItem.
+
+    Args:
+        item: An AVMetadataItem.
+
+    Returns:
+        A tuple of (namespace, key, value) where namespace is the item's key space,
+        key is the title-cased common key, and value is the item's raw value.
+
+    Note:
+        This is the hot inner loop for video metadata parsing; each PyObjC
+        selector is called exactly once per item.
+    """
+    key_space = item.keySpace()
+    namespace = str(key_space) if key_space else ""
+    if key := item.commonKey():
+        # key[:1] handles empty and single-character keys without a length check
+        key = str(key)
+        key = key[:1].upper() + key[1:]
+    else:
+        key = ""  # I've seen null key
+    return namespace, key, item.value()
+
+
+def load_video_all(video_path: FilePath) -> tuple[dict[str, Any], str | None]:
+    """Load both the metadata dictionary and the raw XMP packet from a video file.
+
+    Args:
+        video_path: Path to a video file.
+
+    Returns:
+        A tuple of (metadata, xmp) where metadata is a dictionary of metadata
+        key-value pairs as returned by load_video_metadata and xmp is the raw
+        XMP packet string or None if the video contains no XMP packet.
+
+    Note:
+        This traverses the AVFoundation metadata items once to produce both
+        outputs, which is faster than calling load_video_metadata and
+        load_video_xmp separately as each must walk every item.
+    """
+    with objc.autorelease_pool():
+        asset = _get_asset(video_path)
 
         metadata_formats = asset.availableMetadataFormats()
         metadata_dictionary = {}
+        xmp_packet = None
 
         for format in metadata_formats:
             metadata_items = asset.metadataForFormat_(format)
 
             for item in metadata_items:
-                namespace = str(item.keySpace()) if item.keySpace() else ""
-                if key := item.commonKey():
-                    key = str(key)
-                    key = key[0].upper() + key[1:] if len(key) > 1 else key.upper()
-                else:
-                    key = ""  # I've seen null key
-                value = item.value()
-                if namespace not in metadata_dictionary:
-                    metadata_dictionary[namespace] = {}
+                namespace, key, value = _video_item_fields(item)
+                namespace_dict = metadata_dictionary.setdefault(namespace, {})
                 if value is not None:
                     if namespace == UDTA and not key:
                         # user data, possibly an XMP packet
                         if is_xmp_packet(value):
+                            xmp_packet = value.decode("utf-8")
                             metadata_dictionary[XMP] = (
                                 metadata_dictionary_from_xmp_packet(value)
                             )
                         else:
-                            metadata_dictionary[namespace][key] = str(value)
+                            namespace_dict[key] = str(value)
                     elif namespace == MDTA and key == "Location":
                         try:
                             coordinates = parse_iso_6709(value)
-                            metadata_dictionary[namespace][key] = {
+                            namespace_dict[key] = {
                                 "Latitude": coordinates[0],
                                 "Longitude": coordinates[1],
                                 "Height": coordinates[2],
                                 "CRS": coordinates[3],
                             }
                         except ValueError:
-                            metadata_dictionary[namespace][key] = str(value)
+                            namespace_dict[key] = str(value)
                     else:
-                        metadata_dictionary[namespace][key] = str(value)
-        return metadata_dictionary
+                        namespace_dict[key] = str(value)
+        return metadata_dictionary, xmp_packet
+
+
+def load_video_metadata(video_path: FilePath) -> dict[str, Any]:
+    """Load metadata from a video file using AVFoundation.
 
+    Args:
+        video_path: Path to a video file.
+
+    Returns: A dictionary of metadata key-value pairs.
+    """
+    return load_video_all(video_path)[0]
 
-def load_video_xmp(video_path: FilePath) -> str | None:
+
+def load_video_xmp(video_path: FilePath) -> bytes | None:
     """Load XMP metadata packet from a video file using AVFoundation.
 
     Args:
         video_path: Path to a video file.
 
-    Returns: str containing the XMP metadata packet.
+    Returns: bytes containing the raw XMP metadata packet or None if the video
+        contains no XMP packet.
+
+    Note:
+        The packet is returned as bytes to avoid an O(n) UTF-8 decode of
+        potentially large payloads; use load_video_xmp_str if you need the
+        decoded string form. Callers that also need the metadata dictionary
+        should use load_video_all which produces both outputs in a single pass.
     """
     with objc.autorelease_pool():
-        video_path = str(video_path)
-        video_url = NSURL.fileURLWithPath_(video_path)
-        asset = AVURLAsset.URLAssetWithURL_options_(video_url, None)
+        asset = _get_asset(video_path)
 
         metadata_formats = asset.availableMetadataFormats()
 
         for format in metadata_formats:
+            if format != AVMetadataFormatQuickTimeUserData:
+                # XMP packets are stored in QuickTime user data;
+                # skip other formats without constructing their items' Python proxies
+                continue
             metadata_items = asset.metadataForFormat_(format)
 
             for item in metadata_items:
-                namespace = str(item.keySpace()) if item.keySpace() else ""
-                if key := item.commonKey():
-                    key = str(key)
-                    key = key[0].upper() + key[1:] if len(key) > 1 else key.upper()
-                else:
-                    key = ""  # I've seen null key
+                key_space = item.keySpace()
+                namespace = str(key_space) if key_space else ""
+                if namespace != UDTA or item.commonKey():
+                    continue
                 value = item.value()
-                if value is not None:
-                    if namespace == UDTA and not key:
-                        # user data, possibly an XMP packet
-                        if is_xmp_packet(value):
-                            return value.decode("utf-8")
+                if value is not None and is_xmp_packet(value):
+                    # user data, an XMP packet
+                    return bytes(value)
+            # the user data format appears at most once; no other format can match
+            break
     return None
 
 
+def load_video_xmp_str(video_path: FilePath) -> str | None:
+    """Load XMP metadata packet from a video file as a string.
+
+    Args:
+        video_path: Path to a video file.
+
+    Returns: str containing the XMP metadata packet or None if the video
+        contains no XMP packet.
+    """
+    xmp = load_video_xmp(video_path)
+    return xmp.decode("utf-8") if xmp is not None else None
+
+
 # def load_image_auxilary_data(image_path: FilePath) -> CFDictionaryRef:
 #     """Return the auxiliary data dictionary from the image at the given path."""
 #     with objc.autorelease_pool():
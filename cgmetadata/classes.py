@@ -1,13 +1,17 @@
 """Classes for CGMetadata"""
 
+import io
 import pathlib
+import sys
+from functools import cached_property
 from typing import IO, Any, Literal
 
+import objc
+
 from .cgmetadata import (
-    load_image_metadata_ref,
+    load_image_metadata_ref_mutable,
     load_image_properties,
-    load_video_metadata,
-    load_video_xmp,
+    load_video_all,
 )
 from .constants import (
     EXIF,
@@ -17,11 +21,17 @@ from .constants import (
     UDTA,
     XMP,
     XMP_PACKET_FOOTER,
+    XMP_PACKET_FOOTER_UTF8,
     XMP_PACKET_HEADER,
+    XMP_PACKET_HEADER_UTF8,
 )
 from .metadata import (
+    _DICT_NAMES,
+    MetadataError,
     metadata_dictionary_from_image_metadata_ref,
+    metadata_ref_create_empty_mutable,
     metadata_ref_create_mutable_copy,
+    metadata_ref_get_tag_with_path,
     metadata_ref_set_tag_for_dict,
     metadata_ref_set_tag_with_path,
     metadata_ref_write_to_file,
@@ -31,8 +41,9 @@ from .utils import (
     CFDictionary_to_dict,
     is_image,
     is_video,
-    single_quotes_to_double_quotes,
+    single_quotes_to_double_quotes_bytes,
     strip_xmp_packet,
+    strip_xmp_packet_bytes,
 )
 from .xmp import metadata_ref_create_from_xmp, metadata_ref_serialize_xmp
 
@@ -49,7 +60,10 @@ class ImageMetadata:
     """
 
     def __init__(self, filepath: FilePath):
-        self.filepath = pathlib.Path(filepath).resolve()
+        # resolve() walks every path component reading symlinks; an absolute
+        # path is already usable by the CF APIs so only relative paths pay it
+        path = pathlib.Path(filepath)
+        self.filepath = path if path.is_absolute() else path.resolve()
         if not self.filepath.exists():
             raise FileNotFoundError(f"File not found: {self.filepath}")
         if not is_image(self.filepath):
@@ -67,20 +81,30 @@ class ImageMetadata:
 
         Reference: https://developer.apple.com/documentation/imageio/image_properties?language=objc
         for more information.
+
+        The converted dictionary is cached after the first access; accessing
+        exif/iptc/tiff/gps repeatedly does not re-convert the CFDictionary.
+        The cache is invalidated by reload().
         """
 
+        if self._properties_dict is not None:
+            return self._properties_dict
+
         # change keys to remove the leading '{' and trailing '}'
         # e.g. '{IPTC}' -> 'IPTC' but only if the key starts with '{'
-        # also change Exif -> EXIF, WebP -> WEBP to match the other keys
+        # also change Exif -> EXIF, WebP -> WEBP to match the other keys;
+        # interning the group keys makes lookups against the interned
+        # constants (EXIF, IPTC, ...) pointer comparisons
         properties = CFDictionary_to_dict(self._properties)
         properties = {
-            key[1:-1] if key.startswith("{") else key: value
+            sys.intern(key[1:-1] if key.startswith("{") else key): value
             for key, value in properties.items()
         }
         if "Exif" in properties:
             properties["EXIF"] = properties.pop("Exif")
         if "WebP" in properties:
             properties["WEBP"] = properties.pop("WebP")
+        self._properties_dict = properties
         return properties
 
     @property
@@ -108,8 +132,37 @@ class ImageMetadata:
         """Return the XMP metadata dictionary for the image.
 
         The dictionary keys are in form "prefix:name", e.g. "dc:creator".
+
+        The converted dictionary is cached after the first access, like
+        properties; the cache is invalidated whenever the underlying metadata
+        ref changes (flush of buffered sets, xmp_load*, reload()).
         """
-        return metadata_dictionary_from_image_metadata_ref(self._metadata_ref)
+        self.flush()
+        if self._xmp_dict is None:
+            self._xmp_dict = metadata_dictionary_from_image_metadata_ref(
+                self._metadata_ref
+            )
+        return self._xmp_dict
+
+    def get_xmp_value(self, key: str) -> Any:
+        """Return a single XMP metadata value for the image.
+
+        Args:
+            key: The key in form "prefix:name", e.g. "dc:creator".
+
+        Returns:
+            The parsed value, or None if the key is not present.
+
+        Note:
+            Reads just the one tag from the metadata ref; unlike the xmp
+            property, this does not build the full metadata dictionary. When
+            the full dictionary has already been parsed and cached, the value
+            is answered from the cache instead.
+        """
+        self.flush()
+        if self._xmp_dict is not None:
+            return self._xmp_dict.get(key)
+        return metadata_ref_get_tag_with_path(self._metadata_ref, key)
 
     def xmp_dumps(self, header: bool = True) -> str:
         """Return the serialized XMP metadata for the image.
@@ -119,23 +172,44 @@ class ImageMetadata:
 
         Returns:
             The serialized XMP metadata for the image as a string.
+
+        Note:
+            Serialization runs once per state of the metadata ref; repeated
+            calls (with either header value) return cached strings until the
+            metadata changes.
         """
-        xmp = metadata_ref_serialize_xmp(self._metadata_ref).decode("utf-8")
-        if header:
-            xmp = f"{XMP_PACKET_HEADER}\n{xmp}\n{XMP_PACKET_FOOTER}"
+        self.flush()
+        xmp = self._xmp_dumps_cache.get(header)
+        if xmp is None:
+            xmp = self._xmp_dumps_cache.get(False)
+            if xmp is None:
+                xmp = metadata_ref_serialize_xmp(self._metadata_ref).decode("utf-8")
+                self._xmp_dumps_cache[False] = xmp
+            if header:
+                xmp = "\n".join((XMP_PACKET_HEADER, xmp, XMP_PACKET_FOOTER))
+                self._xmp_dumps_cache[True] = xmp
         return xmp
 
-    def xmp_dump(self, fp: IO[str], header: bool = True):
+    def xmp_dump(self, fp: IO[str] | IO[bytes], header: bool = True):
         """Write the serialized XMP metadata for the image to a file.
 
         Args:
-            fp: The file pointer to write the XMP metadata to.
+            fp: The file pointer to write the XMP metadata to; may be opened
+                in text or binary mode. Binary files receive the serialized
+                UTF-8 bytes directly with no decode/encode round trip.
             header: If True, include the XMP packet header in the serialized XMP.
         """
-        xmp = metadata_ref_serialize_xmp(self._metadata_ref).decode("utf-8")
-        if header:
-            xmp = XMP_PACKET_HEADER + xmp + XMP_PACKET_FOOTER
-        fp.write(xmp)
+        self.flush()
+        xmp = metadata_ref_serialize_xmp(self._metadata_ref)
+        if isinstance(fp, io.TextIOBase):
+            decoded = xmp.decode("utf-8")
+            if header:
+                decoded = XMP_PACKET_HEADER + decoded + XMP_PACKET_FOOTER
+            fp.write(decoded)
+        elif header:
+            fp.write(XMP_PACKET_HEADER_UTF8 + xmp + XMP_PACKET_FOOTER_UTF8)
+        else:
+            fp.write(xmp)
 
     def xmp_loads(self, xmp: str):
         """Load XMP metadata from a string.
@@ -197,18 +271,48 @@ class ImageMetadata:
             You are responsible for passing the correct type of value for the metadata key,
             for example, str or list[str]. See https://github.com/adobe/xmp-docs/tree/master
             for more information on XMP metadata and expected types.
+            Values are buffered and applied to the metadata ref in one pass
+            when the metadata is next read or written (or via flush()), so a
+            script setting many fields pays one traversal instead of one per
+            call; an invalid key or value therefore raises MetadataError at
+            that point rather than here.
         """
-        if group == XMP:
-            self._metadata_ref = metadata_ref_set_tag_with_path(
-                self._metadata_ref, key, value
-            )
-        else:
-            self._metadata_ref = metadata_ref_set_tag_for_dict(
-                self._metadata_ref, group, key, value
-            )
+        if group != XMP and group.upper() not in _DICT_NAMES:
+            raise MetadataError(f"Invalid dictionary {group}")
+        self._pending_sets.append((group, key, value))
+
+    def flush(self):
+        """Apply any buffered set() values to the in-memory metadata ref.
+
+        Called automatically before the metadata is read or written; only
+        needed directly when handing the underlying ref to other code.
+        """
+        if not self._pending_sets:
+            return
+        pending, self._pending_sets = self._pending_sets, []
+        self._xmp_dict = None
+        self._xmp_dumps_cache.clear()
+        with objc.autorelease_pool():
+            for group, key, value in pending:
+                if group == XMP:
+                    self._metadata_ref = metadata_ref_set_tag_with_path(
+                        self._metadata_ref, key, value
+                    )
+                else:
+                    self._metadata_ref = metadata_ref_set_tag_for_dict(
+                        self._metadata_ref, group, key, value
+                    )
 
     def write(self):
-        """Write the metadata to the image file then reloads the metadata from the image."""
+        """Write the metadata to the image file then reloads the metadata from the image.
+
+        If the metadata ref was never loaded (nothing was set or loaded via
+        the xmp_load* methods), there is nothing to write back and the file
+        is left untouched.
+        """
+        self.flush()
+        if "_metadata_ref" not in self.__dict__:
+            return
         metadata_ref_write_to_file(self.filepath, self._metadata_ref)
         self.reload()
 
@@ -218,39 +322,58 @@ class ImageMetadata:
 
     def asdict(self) -> dict[str, Any]:
         """Return the metadata as a dictionary."""
-        dict_data = self.properties.copy()
-        dict_data[XMP] = self.xmp
-        return dict_data
+        # one dict build from the cached properties plus the XMP tags; the
+        # unpacking also keeps the cached properties dict unaliased
+        return {**self.properties, XMP: self.xmp}
+
+    @cached_property
+    def _metadata_ref(self) -> Any:
+        """Mutable XMP metadata ref for the image, loaded on first use.
+
+        Parsing and mutable-copying the XMP tree is the heaviest part of
+        loading an image, and exif/iptc/tiff/gps read only _properties, so
+        the metadata ref is not loaded until something XMP-related (xmp,
+        xmp_dumps, set, write, ...) first touches it.
+        """
+        metadata_ref = load_image_metadata_ref_mutable(self.filepath)
+        if metadata_ref is None:
+            return metadata_ref_create_empty_mutable()
+        return metadata_ref
 
     def _load(self):
-        try:
-            del self._metadata_ref
-        except AttributeError:
-            pass
-        try:
-            del self._properties
-        except AttributeError:
-            pass
-        properties = load_image_properties(self.filepath)
-        self._properties = properties.mutableCopy()
-        del properties
-
-        metadata_ref = load_image_metadata_ref(self.filepath)
-        self._metadata_ref = metadata_ref_create_mutable_copy(metadata_ref)
-        del metadata_ref
+        self._pending_sets: list[tuple[str, str, Any]] = []
+        # drop the lazily computed metadata ref; it reloads on next access
+        # (no explicit del of _properties: rebinding below releases the old
+        # CFDictionary via refcounting)
+        self.__dict__.pop("_metadata_ref", None)
+        self._properties_dict = None
+        self._xmp_dict: dict[str, Any] | None = None
+        self._xmp_dumps_cache: dict[bool, str] = {}
+        # the properties dictionary is only ever read (set() goes through the
+        # metadata ref, and properties_dict_set_tags copies before mutating),
+        # so keep the immutable CFDictionary rather than deep-copying it
+        with objc.autorelease_pool():
+            self._properties = load_image_properties(self.filepath)
 
     def _xmp_set_from_str(self, xmp: str):
         """Set the XMP metadata from a string representing serialized XMP."""
 
         # The Apple API requires that the XMP data use double quotes for quoted strings
-        # and that the XMP data not contain the XMP packet headers
-        xmp = single_quotes_to_double_quotes(xmp)
-        xmp = strip_xmp_packet(xmp)
+        # and that the XMP data not contain the XMP packet headers;
+        # encode once up front so both fixups run on bytes in C-speed passes
         xmp = xmp.encode("utf-8")
+        xmp = single_quotes_to_double_quotes_bytes(xmp)
+        xmp = strip_xmp_packet_bytes(xmp)
         self._xmp_set_from_bytes(xmp)
 
     def _xmp_set_from_bytes(self, xmp: bytes):
         """Set the XMP metadata from a bytes object representing serialized XMP."""
+        # buffered set() values would have been applied to the ref this
+        # replaces, so they are discarded along with it, as is the parsed
+        # dictionary cached from the old ref
+        self._pending_sets.clear()
+        self._xmp_dict = None
+        self._xmp_dumps_cache.clear()
         metadata = metadata_ref_create_from_xmp(xmp)
         self._metadata_ref = metadata_ref_create_mutable_copy(metadata)
         del metadata
@@ -268,10 +391,11 @@ class ImageMetadata:
         self._context_manager = False
 
     def __del__(self):
-        if self._metadata_ref is not None:
-            del self._metadata_ref
-        if self._properties is not None:
-            del self._properties
+        # pop rather than access: reading self._metadata_ref here would
+        # trigger the lazy load just to tear it down again, and _properties
+        # may be missing if construction failed before _load completed
+        self.__dict__.pop("_metadata_ref", None)
+        self.__dict__.pop("_properties", None)
 
 
 class ImageMetaData(ImageMetadata):
@@ -294,7 +418,9 @@ class VideoMetadata:
     """
 
     def __init__(self, filepath: FilePath):
-        self.filepath = pathlib.Path(filepath).resolve()
+        # as in ImageMetadata, only relative paths pay for resolve()
+        path = pathlib.Path(filepath)
+        self.filepath = path if path.is_absolute() else path.resolve()
         if not self.filepath.exists():
             raise FileNotFoundError(f"File not found: {self.filepath}")
         if not is_video(self.filepath):
@@ -328,21 +454,30 @@ class VideoMetadata:
         Returns:
             The serialized XMP metadata for the image as a string.
         """
-        xmp = self._xmp
-        if not header:
-            xmp = strip_xmp_packet(xmp)
-        return xmp
+        if header:
+            return self._xmp
+        if self._xmp_stripped is None and self._xmp is not None:
+            # _xmp only changes on reload(), so strip once and reuse
+            self._xmp_stripped = strip_xmp_packet(self._xmp)
+        return self._xmp_stripped
 
-    def xmp_dump(self, fp: IO[str], header: bool = True):
+    def xmp_dump(self, fp: IO[str] | IO[bytes], header: bool = True):
         """Write the serialized XMP metadata for the video to a file.
 
         Args:
-            fp: The file pointer to write the XMP metadata to.
+            fp: The file pointer to write the XMP metadata to; may be opened
+                in text or binary mode.
             header: If True, include the XMP packet header in the serialized XMP.
         """
         xmp = self.xmp_dumps(header)
-        xmp = xmp.encode("utf-8")
-        fp.write(xmp)
+        if isinstance(fp, io.TextIOBase):
+            fp.write(xmp)
+        else:
+            data = self._xmp_bytes.get(header)
+            if data is None:
+                data = xmp.encode("utf-8")
+                self._xmp_bytes[header] = data
+            fp.write(data)
 
     def reload(self):
         """Reload the metadata from the image file."""
@@ -354,74 +489,14 @@ class VideoMetadata:
         return dict_data
 
     def _load(self):
-        try:
-            del self._properties
-        except AttributeError:
-            pass
-        self._properties = load_video_metadata(self.filepath)
-        self._xmp = load_video_xmp(self.filepath)
+        # rebinding releases the previous values via refcounting
+        self._properties, self._xmp = load_video_all(self.filepath)
+        # caches for the derived XMP forms, valid until the next reload()
+        self._xmp_stripped: str | None = None
+        self._xmp_bytes: dict[bool, bytes] = {}
 
 
 class VideoMetaData(VideoMetadata):
     """Alias for VideoMetadata."""
 
     pass
-
-
-# class XMPMetadata:
-#     """Read and write image metadata properties using native macOS APIs.
-
-#     Args:
-#         filepath: The path to the image file or the XMP sidecar file.
-#             If None, the metadata will be initialized with an empty dictionary.
-#     """
-
-#     def __init__(self, filepath: FilePath | None = None):
-#         self.filepath = filepath
-#         self.init_with_image = is_image(filepath) if filepath else False
-#         self.init_with_xmp = not self.init_with_image and filepath is not None
-#         self._metadata_ref = self._load_metadata_ref()
-
-#     @property
-#     def metadata(self):
-#         """Get the XMP metadata dictionary for the image.
-
-#         The dictionary keys are in form "prefix:name", e.g. "dc:creator".
-#         """
-#         return self._metadata_ref
-
-#     def serialize(self, header: bool = True) -> str:
-#         """Return the serialized XMP metadata for the image.
-
-#         Args:
-#             header: If True, include the XMP packet header in the serialized XMP.
-
-#         Returns: The serialized XMP metadata for the image as a string.
-#         """
-#         xmp = metadata_ref_serialize_xmp(self._metadata_ref)
-
-#         xmp = xmp.decode("utf-8")
-#         if header:
-#             xmp = XMP_PACKET_HEADER + xmp
-
-#         return xmp
-
-#     def _load_metadata_ref(self) -> CGMutableImageMetadataRef:
-#         """Called by __init__ to load the metadata reference."""
-#         if self.init_with_image:
-#             metadata = load_image_metadata_ref(self.filepath)
-#             metadata_ref = metadata_ref_create_mutable_copy(metadata)
-#             del metadata
-#         elif self.init_with_xmp:
-#             xmp = open(self.filepath, "r").read()
-#             xmp = xmp.encode("utf-8")
-#             metadata = metadata_ref_create_from_xmp(xmp)
-#             metadata_ref = metadata_ref_create_mutable_copy(metadata)
-#             del metadata
-#         else:
-#             metadata_ref = metadata_ref_create_empty_mutable()
-#         return metadata_ref
-
-#     def __del__(self):
-#         if self._metadata_ref is not None:
-#             del self._metadata_ref
@@ -7,12 +7,21 @@ import csv
 import json
 import pathlib
 import sys
-from typing import Any
+from typing import Any, Iterator
 
-from rich import print
+# rich is imported only for the default table output; the other branches
+# write to the streams directly so large JSON/XMP dumps skip rich's markup
+# scanning and wrapping
 from rich.console import Console
 from rich.table import Table
 
+# orjson is optional; when installed, large metadata dumps serialize through
+# its native encoder instead of the stdlib
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from ._version import __version__
 from .classes import ImageMetadata, VideoMetadata
 from .utils import is_image, is_video
@@ -70,7 +79,9 @@ def main():
     if not pathlib.Path(args.image).exists():
         print(f"File not found: {args.image}", file=sys.stderr)
         sys.exit(1)
-    if not (is_image(args.image) or is_video(args.image)):
+    image = is_image(args.image)
+    video = False if image else is_video(args.image)
+    if not (image or video):
         print(f"Not an image or video file: {args.image}", file=sys.stderr)
         sys.exit(1)
     if sum([args.csv, args.tsv, args.json, args.xmp]) > 1:
@@ -80,16 +91,26 @@ def main():
         sys.exit(1)
 
     # load metadata and print in the appropriate format
-    if is_image(args.image):
+    if image:
         md = ImageMetadata(args.image)
     else:
         md = VideoMetadata(args.image)
+    if args.xmp:
+        # XMP output needs only the metadata ref; skip the full dict build
+        xmp = md.xmp_dumps(header=not args.no_header)
+        if xmp is None:
+            # videos without an XMP packet return None
+            print(f"No XMP metadata found in file: {args.image}", file=sys.stderr)
+            sys.exit(1)
+        sys.stdout.write(xmp + "\n")
+        sys.exit(0)
+
     dict_data = md.asdict()
 
     if args.json:
         indent = args.indent or None
         json_str = md_dict_to_json(dict_data, indent)
-        print(json_str)
+        sys.stdout.write(json_str + "\n")
         sys.exit(0)
 
     if args.csv:
@@ -100,17 +121,19 @@ def main():
         print_csv(dict_data, delim="\t", header=not args.no_header)
         sys.exit(0)
 
-    if args.xmp:
-        print(md.xmp_dumps(header=not args.no_header))
-        sys.exit(0)
-
     # default output
     print_md_dict(dict_data, args.image)
     sys.exit(0)  # always raise SystemExit for testing
 
 
 def md_dict_to_json(md_dict: dict[str, Any], indent: int = 4) -> str:
-    """Convert a dictionary of metadata to a JSON string."""
+    """Convert a dictionary of metadata to a JSON string.
+
+    Uses orjson when it is installed and the requested indent matches its
+    two-space option (orjson only supports an indent of 2); any other indent
+    falls back to the stdlib encoder. ensure_ascii is disabled so non-ASCII
+    tag values pass through without per-character escaping.
+    """
 
     def default(o):
         if isinstance(o, bytes):
@@ -119,62 +142,65 @@ def md_dict_to_json(md_dict: dict[str, Any], indent: int = 4) -> str:
             f"Object of type {o.__class__.__name__} is not JSON serializable"
         )
 
-    return json.dumps(md_dict, default=default, indent=indent)
+    if orjson is not None and indent in (None, 2):
+        option = orjson.OPT_INDENT_2 if indent else 0
+        return orjson.dumps(md_dict, default=default, option=option).decode("utf-8")
+    return json.dumps(md_dict, default=default, indent=indent, ensure_ascii=False)
 
 
 def format_bytes(b: bytes) -> str:
     """Format bytes as a string for pretty printing."""
     length = len(b)
-    first = min(length, 16)
-    first_bytes = b[:first].hex()
-    value = f"<{length} bytes: {first_bytes}"
-    if length > first:
-        value += "..."
-    value += ">"
-    return value
+    return f"<{length} bytes: {b[:16].hex()}{'...' if length > 16 else ''}>"
+
+
+# formatters keyed by exact type; format_value is called once per cell so a
+# single dict lookup replaces the chain of isinstance checks (subclasses fall
+# through to str, which was already the default)
+_FORMATTERS = {
+    list: lambda value: ", ".join(str(v) for v in value),
+    bytes: format_bytes,
+}
 
 
 def format_value(value: Any) -> Any:
-    if isinstance(value, list):
-        return ", ".join(str(v) for v in value)
-    if isinstance(value, bytes):
-        return format_bytes(value)
-    return str(value)
+    formatter = _FORMATTERS.get(type(value))
+    return formatter(value) if formatter else str(value)
 
 
-def flatten_metadata_dict(
+def _iter_flatten(
     d: dict[str, Any], group_key: str = "", parent_key: str = ""
-) -> list[tuple[str, str, Any]]:
-    """Flatten metadata dictionary into a list of tuples of (group, tag, value)"""
-    items = []
-    for k, v in d.items():
-        if parent_key:
-            new_key = f"{parent_key}.{k}"
-        else:
-            new_key = k
-        if isinstance(v, dict):
-            if group_key:
-                items.extend(flatten_metadata_dict(v, group_key, new_key))
+) -> Iterator[tuple[str, str, Any]]:
+    """Flatten metadata dictionary into tuples of (group, tag, value).
+
+    Iterative generator over an explicit stack: no per-level recursive calls
+    and no intermediate lists; callers that need ordering sort the consumed
+    iterator once (emission order is unspecified).
+    """
+    stack = [(d, group_key, parent_key)]
+    while stack:
+        node, group_key, parent_key = stack.pop()
+        prefix = parent_key + "." if parent_key else ""
+        for k, v in node.items():
+            new_key = prefix + k
+            if isinstance(v, dict):
+                if group_key:
+                    stack.append((v, group_key, new_key))
+                else:
+                    stack.append((v, new_key, ""))
             else:
-                items.extend(flatten_metadata_dict(v, new_key))
-        else:
-            items.append((group_key, new_key, v))
-    return items
+                yield group_key, new_key, v
 
 
 def print_md_dict(md_dict: dict[str, Any], filename: str):
     """Print metadata dictionary."""
 
-    items = sorted(flatten_metadata_dict(md_dict))
     table = Table(title=f"Metadata for {filename}")
     table.add_column("Group")
     table.add_column("Tag")
     table.add_column("Value")
-    for group, tag, value in items:
-        group = group or "None"
-        table.add_row(group, tag, format_value(value))
-        # items_to_print.append((group, tag, format_value(value)))
-        # print(f"{group} : {tag} : {format_value(value)}")
+    for group, tag, value in sorted(_iter_flatten(md_dict)):
+        table.add_row(group or "None", tag, format_value(value))
     console = Console()
     console.print(table)
 
@@ -188,16 +214,11 @@ def print_csv(md_dict: dict[str, Any], delim: str = ",", header: bool = True):
         header: if True, print header row
     """
 
-    items = sorted(flatten_metadata_dict(md_dict))
-    items_to_print = []
-    for group, tag, value in items:
-        group = group or "None"
-        items_to_print.append((group, tag, format_value(value)))
-
     csv_writer = csv.writer(sys.stdout, delimiter=delim)
     if header:
         csv_writer.writerow(["Group", "Tag", "Value"])
-    csv_writer.writerows(items_to_print)
+    for group, tag, value in sorted(_iter_flatten(md_dict)):
+        csv_writer.writerow((group or "None", tag, format_value(value)))
 
 
 if __name__ == "__main__":
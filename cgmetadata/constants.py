@@ -1,17 +1,24 @@
 """Constants for CGMetadata."""
 
+import sys
+
 # XMP packet header and footer for serializing XMP metadata.
 XMP_PACKET_HEADER = '<?xpacket begin="\uFEFF" id="W5M0MpCehiHzreSzNTczkc9d"?>'
 XMP_PACKET_FOOTER = '<?xpacket end="w"?>'
 
-# Metadata types
-XMP = "XMP"
-EXIF = "EXIF"
-IPTC = "IPTC"
-TIFF = "TIFF"
-GPS = "GPS"
-WEBP = "WEBP"
+# UTF-8 encoded forms, encoded once at import for writers that work in bytes
+XMP_PACKET_HEADER_UTF8 = XMP_PACKET_HEADER.encode("utf-8")
+XMP_PACKET_FOOTER_UTF8 = XMP_PACKET_FOOTER.encode("utf-8")
+
+# Metadata types; interned so group comparisons and dict lookups take the
+# CPython pointer-equality fast path against likewise-interned keys
+XMP = sys.intern("XMP")
+EXIF = sys.intern("EXIF")
+IPTC = sys.intern("IPTC")
+TIFF = sys.intern("TIFF")
+GPS = sys.intern("GPS")
+WEBP = sys.intern("WEBP")
 
 # Metadata namespaces
-MDTA = "mdta"
-UDTA = "udta"
+MDTA = sys.intern("mdta")
+UDTA = sys.intern("udta")
@@ -2,6 +2,80 @@
 
 import re
 
+# compiled once at import; compiling inside parse_iso_6709 paid the re cache
+# lookup (hashing the long VERBOSE source string) on every call
+_ISO_6709_RE = re.compile(
+    r"""
+    ^  # Start of string
+    (?P<latitude>[+-]\d+(?:\.\d+)?)  # Latitude with sign and optional decimal
+    (?P<longitude>[+-]\d+(?:\.\d+)?)  # Longitude with sign and optional decimal
+    (?:  # Optional height and CRS group
+        (?P<height>[+-]?\d+(?:\.\d+)?)  # Height with sign and optional decimal
+        # (?:CRS(?P<crs>[^/]+))?  # Optional CRS (string beginning with CRS), only if height is present
+        (?:CRS(?P<crs>.*?(?=\/|$)))?  # Optional CRS (string beginning with CRS), only if height is present
+    )?
+    /?  # Optional trailing "/"
+    $  # End of string
+""",
+    re.VERBOSE,
+)
+
+
+def _scan_float(s: str, start: int, sign_optional: bool = False) -> int:
+    """Return the end index of a float literal at s[start:], or start if none.
+
+    Mirrors the regex component [+-]\\d+(?:\\.\\d+)?: the fraction is consumed
+    only when the dot is followed by at least one digit.
+    """
+    n = len(s)
+    i = start
+    if i < n and (s[i] == "+" or s[i] == "-"):
+        i += 1
+    elif not sign_optional:
+        return start
+    digits_start = i
+    while i < n and "0" <= s[i] <= "9":
+        i += 1
+    if i == digits_start:
+        return start
+    if i < n and s[i] == ".":
+        j = i + 1
+        while j < n and "0" <= s[j] <= "9":
+            j += 1
+        if j > i + 1:
+            i = j
+    return i
+
+
+def _parse_iso_6709_scan(
+    s: str,
+) -> tuple[float, float, float | None, str | None] | None:
+    """Parse the common fully-signed ISO 6709 form with a linear scan.
+
+    Returns None when the string does not parse cleanly left to right; the
+    caller then falls back to the backtracking regex, which also resolves the
+    ambiguous unsigned-height forms (e.g. a height with no sign following a
+    longitude fraction).
+    """
+    lat_end = _scan_float(s, 0)
+    if lat_end == 0:
+        return None
+    lon_end = _scan_float(s, lat_end)
+    if lon_end == lat_end:
+        return None
+    height = None
+    crs = None
+    pos = _scan_float(s, lon_end, sign_optional=True)
+    if pos > lon_end:
+        height = float(s[lon_end:pos])
+        if s.startswith("CRS", pos):
+            rest = s[pos + 3 :]
+            crs = (rest[:-1] if rest.endswith("/") else rest) or None
+            pos = len(s)
+    if s[pos:] not in ("", "/"):
+        return None
+    return float(s[:lat_end]), float(s[lat_end:lon_end]), height, crs
+
 
 def parse_iso_6709(iso_6709_str: str) -> tuple[float, float, float | None, str | None]:
     """
@@ -24,30 +98,19 @@ def parse_iso_6709(iso_6709_str: str) -> tuple[float, float, float | None, str |
     Raises:
         ValueError: If the string is not a valid ISO 6709 string.
     """
-    pattern = re.compile(
-        r"""
-        ^  # Start of string
-        (?P<latitude>[+-]\d+(?:\.\d+)?)  # Latitude with sign and optional decimal
-        (?P<longitude>[+-]\d+(?:\.\d+)?)  # Longitude with sign and optional decimal
-        (?:  # Optional height and CRS group
-            (?P<height>[+-]?\d+(?:\.\d+)?)  # Height with sign and optional decimal
-            # (?:CRS(?P<crs>[^/]+))?  # Optional CRS (string beginning with CRS), only if height is present
-            (?:CRS(?P<crs>.*?(?=\/|$)))?  # Optional CRS (string beginning with CRS), only if height is present
-        )?
-        /?  # Optional trailing "/"
-        $  # End of string
-    """,
-        re.VERBOSE,
-    )
-
-    match = pattern.match(iso_6709_str)
-    if match:
+    result = _parse_iso_6709_scan(iso_6709_str)
+    if result is None:
+        match = _ISO_6709_RE.match(iso_6709_str)
+        if not match:
+            raise ValueError(f"Invalid ISO 6709 location string: {iso_6709_str}")
         latitude = float(match.group("latitude"))
         longitude = float(match.group("longitude"))
         height = float(match.group("height")) if match.group("height") else None
-        crs = match.group("crs") if match.group("crs") else None
-        if crs and not height:
-            raise ValueError(f"CRS cannot be present without height: {iso_6709_str}")
-        return latitude, longitude, height, crs
-    else:
-        raise ValueError(f"Invalid ISO 6709 location string: {iso_6709_str}")
+        # an unmatched optional group is already None; an empty match is also
+        # normalized to None by the `or`
+        crs = match.group("crs") or None
+        result = (latitude, longitude, height, crs)
+    latitude, longitude, height, crs = result
+    if crs and not height:
+        raise ValueError(f"CRS cannot be present without height: {iso_6709_str}")
+    return latitude, longitude, height, crs
@@ -2,6 +2,12 @@
 
 from __future__ import annotations
 
+import concurrent.futures
+import functools
+import os
+import threading
+from collections.abc import Iterable, Iterator, Mapping
+from contextlib import contextmanager
 from typing import Any, Literal
 
 import objc
@@ -20,11 +26,8 @@ from Foundation import (
     NSArray,
     NSData,
     NSDictionary,
-    NSMutableArray,
     NSMutableDictionary,
 )
-from wurlitzer import pipes
-
 from .types import CGMutableImageMetadataRef, FilePath
 
 
@@ -34,6 +37,92 @@ class MetadataError(Exception):
     pass
 
 
+# options for creating CGImageSources: metadata access never needs decoded
+# pixel buffers, so the ImageIO cache is disabled to keep peak memory down
+# during bulk reads and writes
+_NO_CACHE_OPTIONS = {Quartz.kCGImageSourceShouldCache: False}
+
+# CFTypeIDs are process-global constants; computing them once at import saves
+# four bridge calls per node when parsing metadata values
+_TYPE_ID_STRING = CFStringGetTypeID()
+_TYPE_ID_DICTIONARY = CFDictionaryGetTypeID()
+_TYPE_ID_ARRAY = CFArrayGetTypeID()
+_TYPE_ID_TAG = Quartz.CGImageMetadataTagGetTypeID()
+
+# map of dictionary names accepted by metadata_ref_set_tag_for_dict to the
+# Quartz property dictionary constants; built once at import so each call
+# doesn't rebuild the table
+_DICT_NAMES = {
+    "EXIF": Quartz.kCGImagePropertyExifDictionary,
+    "IPTC": Quartz.kCGImagePropertyIPTCDictionary,
+    "GPS": Quartz.kCGImagePropertyGPSDictionary,
+    "WEBP": Quartz.kCGImagePropertyWebPDictionary,
+    "HEIC": Quartz.kCGImagePropertyHEICSDictionary,
+    "CIFF": Quartz.kCGImagePropertyCIFFDictionary,
+    "DNG": Quartz.kCGImagePropertyDNGDictionary,
+    "GIF": Quartz.kCGImagePropertyGIFDictionary,
+    "JFIF": Quartz.kCGImagePropertyJFIFDictionary,
+    "PNG": Quartz.kCGImagePropertyPNGDictionary,
+    "TGA": Quartz.kCGImagePropertyTGADictionary,
+    "TIFF": Quartz.kCGImagePropertyTIFFDictionary,
+    "8BIM": Quartz.kCGImageProperty8BIMDictionary,
+}
+
+
+# set CGMETADATA_SUPPRESS_STDERR=0 to keep native diagnostics visible (and
+# skip the descriptor juggling) on macOS versions that don't emit the
+# AVEBridge noise or when debugging a failing write; checked once at import
+_SUPPRESS_OUTPUT = os.environ.get("CGMETADATA_SUPPRESS_STDERR") != "0"
+
+# fds 1/2 are process-global, so concurrent writers (write_properties_to_many)
+# must not each dup/restore them independently: a thread saving fd 1 while
+# another thread has it pointed at /dev/null would "restore" the devnull and
+# swallow all later output. The redirect is refcounted under a lock instead:
+# the first entrant installs it, the last one restores the original fds.
+_suppress_lock = threading.Lock()
+_suppress_depth = 0
+_suppress_saved: tuple[int, int, int] | None = None
+
+
+@contextmanager
+def _suppress_output():
+    """Silence stdout/stderr at the file-descriptor level around a native call.
+
+    On some versions of macOS, CGImageDestination writes log an AVEBridge
+    diagnostic line (AVEBridge Info: AVEEncoder_CreateInstance: ...) even
+    though the operation succeeds. wurlitzer.pipes() silenced it but spawns a
+    pump thread and creates pipes on every call; duplicating the descriptors
+    onto /dev/null costs a few syscalls instead. Safe to enter from several
+    threads at once; the native calls themselves run without holding the lock.
+    """
+    global _suppress_depth, _suppress_saved
+    if not _SUPPRESS_OUTPUT:
+        yield
+        return
+    with _suppress_lock:
+        if _suppress_depth == 0:
+            devnull = os.open(os.devnull, os.O_WRONLY)
+            saved_stdout = os.dup(1)
+            saved_stderr = os.dup(2)
+            os.dup2(devnull, 1)
+            os.dup2(devnull, 2)
+            _suppress_saved = (saved_stdout, saved_stderr, devnull)
+        _suppress_depth += 1
+    try:
+        yield
+    finally:
+        with _suppress_lock:
+            _suppress_depth -= 1
+            if _suppress_depth == 0:
+                saved_stdout, saved_stderr, devnull = _suppress_saved
+                _suppress_saved = None
+                os.dup2(saved_stdout, 1)
+                os.dup2(saved_stderr, 2)
+                os.close(saved_stdout)
+                os.close(saved_stderr)
+                os.close(devnull)
+
+
 def metadata_ref_create_mutable_copy(
     metadata_ref: Quartz.CGImageMetadataRef | CGMutableImageMetadataRef,
 ) -> CGMutableImageMetadataRef:
@@ -61,14 +150,18 @@ def metadata_ref_set_tag_with_path(
         value: The value to set
 
     Returns: CGMutableImageMetadataRef with the tag set to value
+
+    Note:
+        CGImageMetadataSetValueWithPath returns a bool and creates no
+        autoreleased objects so no autorelease pool is needed here; callers
+        setting many tags can wrap the loop in batch_tag_writer.
     """
-    with objc.autorelease_pool():
-        if Quartz.CGImageMetadataSetValueWithPath(metadata_ref, None, tag_path, value):
-            return metadata_ref
-        raise MetadataError(
-            f"Could not set tag {tag_path} to {value}; "
-            "verify the tag and value are valid and that metadata_ref is a CGMutableImageMetadataRef"
-        )
+    if Quartz.CGImageMetadataSetValueWithPath(metadata_ref, None, tag_path, value):
+        return metadata_ref
+    raise MetadataError(
+        f"Could not set tag {tag_path} to {value}; "
+        "verify the tag and value are valid and that metadata_ref is a CGMutableImageMetadataRef"
+    )
 
 
 def metadata_ref_set_tag_for_dict(
@@ -102,34 +195,44 @@ def metadata_ref_set_tag_for_dict(
 
     Returns: CGMutableImageMetadataRef with the tag set to value
     """
-    dict_names = {
-        "EXIF": Quartz.kCGImagePropertyExifDictionary,
-        "IPTC": Quartz.kCGImagePropertyIPTCDictionary,
-        "GPS": Quartz.kCGImagePropertyGPSDictionary,
-        "WEBP": Quartz.kCGImagePropertyWebPDictionary,
-        "HEIC": Quartz.kCGImagePropertyHEICSDictionary,
-        "CIFF": Quartz.kCGImagePropertyCIFFDictionary,
-        "DNG": Quartz.kCGImagePropertyDNGDictionary,
-        "GIF": Quartz.kCGImagePropertyGIFDictionary,
-        "JFIF": Quartz.kCGImagePropertyJFIFDictionary,
-        "PNG": Quartz.kCGImagePropertyPNGDictionary,
-        "TGA": Quartz.kCGImagePropertyTGADictionary,
-        "TIFF": Quartz.kCGImagePropertyTIFFDictionary,
-        "8BIM": Quartz.kCGImageProperty8BIMDictionary,
-    }
-    dict_name = dict_names.get(dictionary.upper())
+    # fast path for already-uppercase names (the common case); only miss
+    # pays for the .upper() normalization
+    dict_name = _DICT_NAMES.get(dictionary) or _DICT_NAMES.get(dictionary.upper())
     if not dict_name:
         raise MetadataError(f"Invalid dictionary {dictionary}")
 
+    if Quartz.CGImageMetadataSetValueMatchingImageProperty(
+        metadata_ref, dict_name, tag, value
+    ):
+        return metadata_ref
+    raise MetadataError(
+        f"Could not set tag {tag} to {value} for dictionary {dict_name}; "
+        "verify the dictionary, tag, and value are valid and that metadata_ref is a CGMutableImageMetadataRef"
+    )
+
+
+@contextmanager
+def batch_tag_writer(metadata_ref: CGMutableImageMetadataRef):
+    """Context manager providing a setter for writing many tags under one autorelease pool.
+
+    Args:
+        metadata_ref: A CGMutableImageMetadataRef to set tags on.
+
+    Yields:
+        A function set_tag(tag_path, value) that sets a tag via
+        metadata_ref_set_tag_with_path.
+
+    Example:
+        with batch_tag_writer(metadata_ref) as set_tag:
+            for tag_path, value in tags.items():
+                set_tag(tag_path, value)
+    """
     with objc.autorelease_pool():
-        if Quartz.CGImageMetadataSetValueMatchingImageProperty(
-            metadata_ref, dict_name, tag, value
-        ):
-            return metadata_ref
-        raise MetadataError(
-            f"Could not set tag {tag} to {value} for dictionary {dict_name}; "
-            "verify the dictionary, tag, and value are valid and that metadata_ref is a CGMutableImageMetadataRef"
-        )
+
+        def set_tag(tag_path: str, value: Any) -> CGMutableImageMetadataRef:
+            return metadata_ref_set_tag_with_path(metadata_ref, tag_path, value)
+
+        yield set_tag
 
 
 def metadata_ref_write_to_file(
@@ -141,10 +244,16 @@ def metadata_ref_write_to_file(
     Args:
         image_path: Path to the image file.
         metadata_ref: A CGImageMetadataRef containing the metadata to write.
+
+    Note:
+        The encoded image data is copied from the source unchanged via
+        CGImageDestinationCopyImageSource; the image is never decoded and
+        re-encoded just to update the metadata.
     """
     with objc.autorelease_pool():
-        image_url = NSURL.fileURLWithPath_(str(image_path))
-        image_source = Quartz.CGImageSourceCreateWithURL(image_url, None)
+        # isDirectory:False avoids the stat fileURLWithPath: would perform
+        image_url = NSURL.fileURLWithPath_isDirectory_(str(image_path), False)
+        image_source = Quartz.CGImageSourceCreateWithURL(image_url, _NO_CACHE_OPTIONS)
         if not image_source:
             raise MetadataError(f"Could not create image source for {image_path}")
         image_type = Quartz.CGImageSourceGetType(image_source)
@@ -153,23 +262,16 @@ def metadata_ref_write_to_file(
         )
         if not destination:
             raise MetadataError(f"Could not create image destination for {image_path}")
-        with pipes() as (_out, _err):
-            # On some versions of macOS this causes error to stdout
-            # of form: AVEBridge Info: AVEEncoder_CreateInstance: Received CreateInstance (from VT)...
-            # even though the operation succeeds
-            # Use pipes() to suppress this error
-            image_data = Quartz.CGImageSourceCreateImageAtIndex(image_source, 0, None)
-            Quartz.CGImageDestinationAddImageAndMetadata(
-                destination,
-                image_data,
-                metadata_ref,
-                None,
+        options = {
+            Quartz.kCGImageDestinationMetadata: metadata_ref,
+            Quartz.kCGImageDestinationMergeMetadata: False,
+        }
+        with _suppress_output():
+            success, error = Quartz.CGImageDestinationCopyImageSource(
+                destination, image_source, options, None
             )
-            Quartz.CGImageDestinationFinalize(destination)
-
-        del destination
-        del image_data
-        del image_source
+        if not success:
+            raise MetadataError(f"Could not write metadata to {image_path}: {error}")
 
 
 def properties_dict_write_to_file(
@@ -183,8 +285,9 @@ def properties_dict_write_to_file(
         properties: A CFDictionaryRef containing the properties to write.
     """
     with objc.autorelease_pool():
-        image_url = NSURL.fileURLWithPath_(str(image_path))
-        image_source = Quartz.CGImageSourceCreateWithURL(image_url, None)
+        # isDirectory:False avoids the stat fileURLWithPath: would perform
+        image_url = NSURL.fileURLWithPath_isDirectory_(str(image_path), False)
+        image_source = Quartz.CGImageSourceCreateWithURL(image_url, _NO_CACHE_OPTIONS)
         if not image_source:
             raise MetadataError(f"Could not create image source for {image_path}")
         image_type = Quartz.CGImageSourceGetType(image_source)
@@ -193,20 +296,80 @@ def properties_dict_write_to_file(
         )
         if not destination:
             raise MetadataError(f"Could not create image destination for {image_path}")
-        with pipes() as (_out, _err):
-            # On some versions of macOS this causes error to stdout
-            # of form: AVEBridge Info: AVEEncoder_CreateInstance: Received CreateInstance (from VT)...
-            # even though the operation succeeds
-            # Use pipes() to suppress this error
-            image_data = Quartz.CGImageSourceCreateImageAtIndex(image_source, 0, None)
+        with _suppress_output():
             Quartz.CGImageDestinationAddImageFromSource(
                 destination, image_source, 0, properties
             )
             Quartz.CGImageDestinationFinalize(destination)
 
-        del destination
-        del image_data
-        del image_source
+
+def write_properties_to_many(
+    image_paths: Iterable[FilePath],
+    properties: CFDictionaryRef,
+    workers: int | None = None,
+) -> None:
+    """Write the same properties dictionary to many image files concurrently.
+
+    Args:
+        image_paths: Iterable of paths to image files.
+        properties: A CFDictionaryRef containing the properties to write,
+            shared by every file; built once by the caller and reused across
+            all destinations.
+        workers: Number of worker threads; if None, uses the
+            concurrent.futures default based on the CPU count.
+
+    Note:
+        ImageIO releases the GIL during the copy so writes scale across
+        threads; each worker runs inside its own (thread-local) autorelease
+        pool via properties_dict_write_to_file.
+    """
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+        writer = functools.partial(
+            properties_dict_write_to_file, properties=properties
+        )
+        # consume the iterator so any worker exception propagates to the caller
+        list(executor.map(writer, image_paths))
+
+
+def properties_dict_set_tags(
+    properties_dict: CFDictionaryRef,
+    updates: dict[tuple[str | None, str], Any],
+) -> CFDictionaryRef:
+    """Set multiple tags in a CFDictionaryRef as returned by load_image_properties.
+
+    Args:
+        properties_dict: A CFDictionaryRef
+        updates: Mapping of (sub_dict, tag) to the value to set; sub_dict is
+            the sub dictionary to set or None if the tag is not in a sub dictionary
+
+    Returns: CFDictionaryRef with all tags set
+
+    Note:
+        The properties dictionary and each touched sub dictionary are copied
+        once regardless of how many tags are set, unlike repeated calls to
+        properties_dict_set_tag which copy the full tree per tag.
+    """
+    mutable_dict = properties_dict.mutableCopy()
+    sub_dict_copies = {}
+    for (sub_dict, tag), value in updates.items():
+        if sub_dict:
+            dict_ref = sub_dict_copies.get(sub_dict)
+            if dict_ref is None:
+                # objectForKey_ returns None on a missing key rather than
+                # raising KeyError through the bridge's __getitem__
+                dict_ref = mutable_dict.objectForKey_(sub_dict)
+                dict_ref = (
+                    dict_ref.mutableCopy()
+                    if dict_ref is not None
+                    else NSMutableDictionary.dictionary()
+                )
+                sub_dict_copies[sub_dict] = dict_ref
+            dict_ref[tag] = value
+        else:
+            mutable_dict[tag] = value
+    for sub_dict, dict_ref in sub_dict_copies.items():
+        mutable_dict[sub_dict] = dict_ref
+    return mutable_dict
 
 
 def properties_dict_set_tag(
@@ -222,89 +385,220 @@ def properties_dict_set_tag(
 
     Returns: CFDictionaryRef with the tag set to value
     """
-    mutable_dict = properties_dict.mutableCopy()
-    if sub_dict:
-        dict_ref = mutable_dict[sub_dict].mutableCopy()
-        if not dict_ref:
-            dict_ref = NSMutableDictionary.dictionary()
-        dict_ref[tag] = value
-        mutable_dict[sub_dict] = dict_ref
-        return mutable_dict
+    return properties_dict_set_tags(properties_dict, {(sub_dict, tag): value})
 
-    mutable_dict[tag] = value
-    return mutable_dict
+
+# converters keyed by concrete bridged class, filled in lazily by
+# _resolve_NS_handler; ObjC class clusters (NSDictionary, NSArray, NSNumber)
+# surface many concrete subclasses so the table cannot be enumerated up front,
+# but each subclass resolves once and every later value of that class is a
+# single dict lookup instead of a chain of isinstance checks
+_NS_HANDLERS: dict[type, Any] = {
+    type(None): lambda value: None,
+    str: str,  # str() of an exact str returns the same object, no copy
+}
+
+
+def _resolve_NS_handler(cls: type) -> Any:
+    """Pick the converter for a concrete bridged class and memoize it.
+
+    NSNumber bridges to int/float/bool subclasses; numbers pass through as
+    plain Python numbers rather than being coerced to str, which loses the
+    type and forces callers to re-parse (e.g. float() on GPS coordinates).
+    """
+    if issubclass(cls, bool):
+        handler = bool
+    elif issubclass(cls, int):
+        handler = int
+    elif issubclass(cls, float):
+        handler = float
+    elif issubclass(cls, NSDictionary):
+        handler = NSDictionary_to_dict_recursive
+    elif issubclass(cls, NSArray):
+        handler = NSArray_to_list_recursive
+    elif issubclass(cls, NSData):
+        # NSData supports the buffer protocol; bytes() copies it out directly
+        handler = bytes
+    else:
+        handler = str
+    _NS_HANDLERS[cls] = handler
+    return handler
+
+
+def _NS_value_to_py(value: Any) -> Any:
+    """Convert a single NS value to the Python equivalent; handles subset of types needed for image metadata."""
+    handler = _NS_HANDLERS.get(type(value))
+    if handler is None:
+        handler = _resolve_NS_handler(type(value))
+    return handler(value)
 
 
 def NSDictionary_to_dict_recursive(ns_dict: NSDictionary) -> dict[str, Any]:
-    """Convert an NSDictionary to a Python dict recursively; handles subset of types needed for image metadata."""
+    """Convert an NSDictionary to a Python dict; handles subset of types needed for image metadata.
+
+    Nested dictionaries are walked with an explicit stack rather than Python
+    recursion to avoid per-level function call overhead on deeply nested
+    metadata (e.g. HEIC maker-note subtrees); values inside arrays still go
+    through the recursive converters.
+    """
     py_dict = {}
-    for key, value in ns_dict.items():
-        if isinstance(value, NSDictionary):
-            py_dict[key] = NSDictionary_to_dict_recursive(value)
-        elif isinstance(value, NSArray):
-            py_dict[key] = NSArray_to_list_recursive(value)
-        elif isinstance(value, NSData):
-            py_dict[key] = value.bytes().tobytes()
-        else:
-            py_dict[key] = str(value)
+    stack = [(ns_dict, py_dict)]
+    while stack:
+        node, out = stack.pop()
+        for key, value in node.items():
+            # coerce NSString keys to plain str once so later lookups hash and
+            # compare as native Python strings instead of bridged NSStrings
+            key = str(key)
+            if isinstance(value, NSDictionary):
+                sub = {}
+                out[key] = sub
+                stack.append((value, sub))
+            else:
+                out[key] = _NS_value_to_py(value)
     return py_dict
 
 
 def NSArray_to_list_recursive(ns_array: NSArray) -> list[Any]:
-    """Convert an NSArray to a Python list recursively; handles subset of types needed for image metadata."""
-    py_list = []
-    for value in ns_array:
-        if isinstance(value, NSDictionary):
-            py_list.append(NSDictionary_to_dict_recursive(value))
-        elif isinstance(value, NSArray):
-            py_list.append(NSArray_to_list_recursive(value))
-        elif isinstance(value, NSData):
-            py_list.append(value.bytes().tobytes())
-        else:
-            py_list.append(str(value))
-    return py_list
+    """Convert an NSArray to a Python list recursively; handles subset of types needed for image metadata.
+
+    Elements are fetched by index via CFArrayGetValueAtIndex rather than the
+    pyobjc iterator protocol, which would create an NSEnumerator and bridge
+    each step; for large arrays (e.g. IPTC keywords) this is one bridged call
+    per element.
+    """
+    get_at = CFArrayGetValueAtIndex
+    convert = _NS_value_to_py
+    return [convert(get_at(ns_array, i)) for i in range(CFArrayGetCount(ns_array))]
 
 
 def metadata_dictionary_from_image_metadata_ref(
     metadata_ref: Quartz.CGImageMetadataRef,
 ) -> dict[str, Any]:
     with objc.autorelease_pool():
-        tags = Quartz.CGImageMetadataCopyTags(metadata_ref)
-        if not tags:
-            return {}
+        # enumerate with a block: the path argument arrives as the combined
+        # "prefix:name" string, so each tag costs one CopyValue call instead
+        # of CopyPrefix + CopyName + CopyValue
+        metadata_dict: dict[str, Any] = {}
+        set_item = metadata_dict.__setitem__
+        copy_value = Quartz.CGImageMetadataTagCopyValue
+        parse = _recursive_parse_metadata_value
+
+        def collect_tag(path: str, tag: Any) -> bool:
+            set_item(str(path), parse(copy_value(tag)))
+            return True
+
+        Quartz.CGImageMetadataEnumerateTagsUsingBlock(
+            metadata_ref, None, None, collect_tag
+        )
+        return metadata_dict
+
+
+def metadata_ref_get_tag_with_path(
+    metadata_ref: Quartz.CGImageMetadataRef, tag_path: str
+) -> Any:
+    """Copy and parse a single tag value from a CGImageMetadataRef.
+
+    Args:
+        metadata_ref: A CGImageMetadataRef
+        tag_path: The tag path in form "prefix:name", e.g. "dc:creator"
+
+    Returns: The parsed tag value, or None if the tag is not present.
+
+    Note:
+        Reads one tag without enumerating or converting the full tree;
+        LazyMetadataDict builds on the same call with per-key caching.
+    """
+    with objc.autorelease_pool():
+        tag = Quartz.CGImageMetadataCopyTagWithPath(metadata_ref, None, tag_path)
+        if tag is None:
+            return None
+        return _recursive_parse_metadata_value(Quartz.CGImageMetadataTagCopyValue(tag))
+
+
+class LazyMetadataDict(Mapping):
+    """Read-only mapping over a CGImageMetadataRef that parses tags on access.
+
+    The mapping keys are in form "prefix:name", e.g. "dc:creator". Values are
+    copied out of the metadata ref and parsed only when first accessed (then
+    cached), so a caller that reads one key never pays for walking the full
+    XMP tree; use metadata_dictionary_from_image_metadata_ref for an eagerly
+    built plain dict.
+    """
+
+    def __init__(self, metadata_ref: Quartz.CGImageMetadataRef):
+        self._metadata_ref = metadata_ref
+        self._values: dict[str, Any] = {}
+        self._keys: list[str] | None = None
+
+    def _all_keys(self) -> list[str]:
+        """Return the tag keys, reading them from the metadata ref on first use."""
+        if self._keys is None:
+            with objc.autorelease_pool():
+                # the block path argument is the combined "prefix:name" string,
+                # saving the CopyPrefix/CopyName round trips per tag
+                keys: list[str] = []
+                append = keys.append
+
+                def collect_key(path: str, tag: Any) -> bool:
+                    append(str(path))
+                    return True
+
+                Quartz.CGImageMetadataEnumerateTagsUsingBlock(
+                    self._metadata_ref, None, None, collect_key
+                )
+                self._keys = keys
+        return self._keys
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return self._values[key]
+        except KeyError:
+            pass
+        with objc.autorelease_pool():
+            tag = Quartz.CGImageMetadataCopyTagWithPath(self._metadata_ref, None, key)
+            if tag is None:
+                raise KeyError(key)
+            value = _recursive_parse_metadata_value(
+                Quartz.CGImageMetadataTagCopyValue(tag)
+            )
+        self._values[key] = value
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._all_keys())
+
+    def __len__(self) -> int:
+        return len(self._all_keys())
+
 
-        metadata_dict = {}
-        for i in range(CFArrayGetCount(tags)):
-            tag = CFArrayGetValueAtIndex(tags, i)
+def _parse_metadata_cf_dict(value: Any) -> dict[str, Any]:
+    parse = _recursive_parse_metadata_value
+    return {str(key): parse(value[key]) for key in value}
 
-            prefix = Quartz.CGImageMetadataTagCopyPrefix(tag)
-            name = Quartz.CGImageMetadataTagCopyName(tag)
-            value = Quartz.CGImageMetadataTagCopyValue(tag)
 
-            key = f"{prefix}:{name}"
-            object_value = _recursive_parse_metadata_value(value)
-            metadata_dict[key] = object_value
+def _parse_metadata_cf_array(value: Any) -> list[Any]:
+    parse = _recursive_parse_metadata_value
+    return [parse(element) for element in value]
 
-        return metadata_dict.copy()
+
+def _parse_metadata_cf_tag(value: Any) -> Any:
+    return _recursive_parse_metadata_value(Quartz.CGImageMetadataTagCopyValue(value))
+
+
+# handlers for _recursive_parse_metadata_value keyed by CFTypeID; a single
+# dict lookup replaces the if/elif chain of TypeID comparisons per node
+_CF_TYPE_HANDLERS = {
+    _TYPE_ID_STRING: str,
+    _TYPE_ID_DICTIONARY: _parse_metadata_cf_dict,
+    _TYPE_ID_ARRAY: _parse_metadata_cf_array,
+    _TYPE_ID_TAG: _parse_metadata_cf_tag,
+}
 
 
 def _recursive_parse_metadata_value(value: Any) -> Any:
-    if CFGetTypeID(value) == CFStringGetTypeID():
+    # pyobjc bridges NSString to a str subclass, so the common string leaf can
+    # be handled with a cheap isinstance check and no CFGetTypeID bridge calls
+    if isinstance(value, str):
         return str(value)
-    elif CFGetTypeID(value) == CFDictionaryGetTypeID():
-        value_dict = NSMutableDictionary.dictionary()
-        original_dict = NSDictionary.dictionaryWithDictionary_(value)
-        for key in original_dict.allKeys():
-            value_dict[key] = _recursive_parse_metadata_value(original_dict[key])
-        return NSDictionary_to_dict_recursive(value_dict)
-    elif CFGetTypeID(value) == CFArrayGetTypeID():
-        value_array = NSMutableArray.array()
-        original_array = NSArray.arrayWithArray_(value)
-        for element in original_array:
-            value_array.addObject_(_recursive_parse_metadata_value(element))
-        return NSArray_to_list_recursive(value_array)
-    elif CFGetTypeID(value) == Quartz.CGImageMetadataTagGetTypeID():
-        tag_value = Quartz.CGImageMetadataTagCopyValue(value)
-        return _recursive_parse_metadata_value(tag_value)
-    else:
-        return value
+    handler = _CF_TYPE_HANDLERS.get(CFGetTypeID(value))
+    return value if handler is None else handler(value)
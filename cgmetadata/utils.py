@@ -2,17 +2,56 @@
 
 from __future__ import annotations
 
+import os
 import re
+from functools import lru_cache
 from typing import Any
 
 import AppKit
 import objc
 from Foundation import NSURL, CFArrayRef, CFDataRef, CFDictionaryRef
-from utitools import conforms_to_uti, uti_for_path
+from utitools import conforms_to_uti, uti_for_suffix
 
 from .types import FilePath
 
 
+# common image/video extensions answered without consulting the type system;
+# anything not listed falls through to the (cached) UTI conformance check, so
+# these sets only need to cover the frequent cases, not be exhaustive
+_IMAGE_SUFFIXES = frozenset(
+    {
+        ".avif",
+        ".bmp",
+        ".cr2",
+        ".cr3",
+        ".dng",
+        ".gif",
+        ".heic",
+        ".heif",
+        ".jpeg",
+        ".jpg",
+        ".nef",
+        ".png",
+        ".raf",
+        ".tif",
+        ".tiff",
+        ".webp",
+    }
+)
+_VIDEO_SUFFIXES = frozenset({".avi", ".m4v", ".mov", ".mp4", ".mpg", ".mpeg"})
+
+
+@lru_cache(maxsize=128)
+def _suffix_conforms_to_uti(suffix: str, uti: str) -> bool:
+    """Return True if a file suffix conforms to the given UTI.
+
+    The UTI for a given suffix never changes within a process, so the answer
+    is cached; batch workloads over many same-type files resolve the UTI once
+    instead of querying the type system per file.
+    """
+    return conforms_to_uti(uti_for_suffix(suffix), uti)
+
+
 def is_image(filepath: FilePath) -> bool:
     """Return True if the file at `filepath` is an image file.
 
@@ -25,7 +64,10 @@ def is_image(filepath: FilePath) -> bool:
     UTI is determined by the file extension.
     """
 
-    return conforms_to_uti(uti_for_path(filepath), "public.image")
+    suffix = os.path.splitext(os.fspath(filepath))[1].lower()
+    if suffix in _IMAGE_SUFFIXES:
+        return True
+    return _suffix_conforms_to_uti(suffix, "public.image")
 
 
 def is_video(filepath: FilePath) -> bool:
@@ -40,25 +82,55 @@ def is_video(filepath: FilePath) -> bool:
     UTI is determined by the file extension.
     """
 
-    return conforms_to_uti(uti_for_path(filepath), "public.movie")
+    suffix = os.path.splitext(os.fspath(filepath))[1].lower()
+    if suffix in _VIDEO_SUFFIXES:
+        return True
+    return _suffix_conforms_to_uti(suffix, "public.movie")
+
+
+# translation table for the bytes fast path of quote conversion
+_QUOTE_TABLE = bytes.maketrans(b"'", b'"')
+
+
+# matches either a backslash escape (left alone, so \\' stays escaped and the
+# backslash in an escaped backslash cannot mask the quote that follows) or a
+# bare single quote
+_QUOTE_SCAN_RE = re.compile(r"\\.|'")
+
+
+def _quote_repl(match: re.Match) -> str:
+    text = match.group()
+    return '"' if text == "'" else text
 
 
 def single_quotes_to_double_quotes(s: str) -> str:
-    """Replace single quotes with double quotes in a string."""
+    """Replace unescaped single quotes with double quotes in a string.
+
+    A single scan: the pattern consumes backslash escapes whole, so escaped
+    quotes survive without the placeholder round trip the old implementation
+    used to hide escaped backslashes from a lookbehind.
+    """
+    return _QUOTE_SCAN_RE.sub(_quote_repl, s)
 
-    # this is a bit of hack
 
-    # replace all escaped backslashes with a placeholder
-    placeholder = "\u0000\u0001\u0000"
-    s = s.replace(r"\\", placeholder)
+def single_quotes_to_double_quotes_bytes(s: bytes) -> bytes:
+    """Replace single quotes with double quotes in UTF-8 encoded XMP bytes.
 
-    # replace all single quotes with double quotes except for escaped single quotes
-    s = re.sub(r"(?<!\\)'", '"', s)
+    bytes counterpart of single_quotes_to_double_quotes that avoids a
+    decode/re-encode round trip. When the data contains no backslash at all
+    there can be no escaped quotes, so a single C-speed bytes.translate pass
+    is equivalent; otherwise fall back to the escape-aware str implementation.
+    """
+    if b"\\" not in s:
+        return s.translate(_QUOTE_TABLE)
+    return single_quotes_to_double_quotes(s.decode("utf-8")).encode("utf-8")
 
-    # replace all placeholders with escaped backslashes
-    s = s.replace(placeholder, r"\\")
 
-    return s
+# str patterns for strip_xmp_packet, compiled once at import
+_XMP_HEADER_RE = re.compile(
+    r"<\?xpacket begin=['\"]\ufeff['\"] id=['\"]W5M0MpCehiHzreSzNTczkc9d['\"]\?>"
+)
+_XMP_FOOTER_RE = re.compile(r"<\?xpacket end=['\"]w['\"]\?>")
 
 
 def strip_xmp_packet(xmp: str) -> str:
@@ -69,42 +141,93 @@ def strip_xmp_packet(xmp: str) -> str:
 
     Returns: The XMP string with the packet header and footer removed.
     """
-    header_pattern = (
-        r"<\?xpacket begin=['\"]\ufeff['\"] id=['\"]W5M0MpCehiHzreSzNTczkc9d['\"]\?>"
-    )
-    footer_pattern = r"<\?xpacket end=['\"]w['\"]\?>"
+    xmp = _XMP_HEADER_RE.sub("", xmp)
+    xmp = _XMP_FOOTER_RE.sub("", xmp)
+
+    return xmp.strip()
+
 
-    xmp = re.sub(header_pattern, "", xmp)
-    xmp = re.sub(footer_pattern, "", xmp)
+# bytes patterns for strip_xmp_packet_bytes, compiled once at import
+# (\xef\xbb\xbf is the UTF-8 encoding of ﻿)
+_XMP_HEADER_BYTES_RE = re.compile(
+    rb"<\?xpacket begin=['\"]\xef\xbb\xbf['\"] id=['\"]W5M0MpCehiHzreSzNTczkc9d['\"]\?>"
+)
+_XMP_FOOTER_BYTES_RE = re.compile(rb"<\?xpacket end=['\"]w['\"]\?>")
 
+
+def strip_xmp_packet_bytes(xmp: bytes) -> bytes:
+    """Strip XMP packet header and footer from UTF-8 encoded XMP bytes.
+
+    bytes counterpart of strip_xmp_packet; operates directly on the encoded
+    data so callers preparing XMP for the native APIs never decode it.
+    """
+    xmp = _XMP_HEADER_BYTES_RE.sub(b"", xmp)
+    xmp = _XMP_FOOTER_BYTES_RE.sub(b"", xmp)
     return xmp.strip()
 
 
+def _cf_url_to_path(value: Any) -> str:
+    return str(value.path())
+
+
+def _cf_list_to_list(value: Any) -> list:
+    return [cftype_to_pytype(v) for v in value]
+
+
+def _cf_passthrough(value: Any) -> Any:
+    return value
+
+
+# converters keyed by concrete class, filled in lazily by
+# _resolve_cf_converter; CF/NS class clusters surface many concrete
+# subclasses, so each one resolves through the issubclass chain once and
+# every later value of that class is a single dict lookup
+_CF_CONVERTERS: dict[type, Any] = {}
+
+
+def _resolve_cf_converter(cls: type) -> Any:
+    """Pick the converter for a concrete bridged class and memoize it."""
+    if issubclass(cls, NSURL):
+        converter = _cf_url_to_path
+    elif issubclass(cls, objc.pyobjc_unicode):
+        converter = str
+    elif issubclass(cls, CFDataRef):
+        converter = bytes
+    elif issubclass(cls, objc._pythonify.OC_PythonLong):
+        converter = int
+    elif issubclass(cls, objc._pythonify.OC_PythonFloat):
+        converter = float
+    elif issubclass(cls, list):
+        converter = _cf_list_to_list
+    else:
+        converter = _cf_passthrough
+    _CF_CONVERTERS[cls] = converter
+    return converter
+
+
 def cftype_to_pytype(value: Any) -> Any:
     """Convert a Core Foundation type to a python type
     This doesn't cover every type but covers types I've seen in metadata
     """
-    if isinstance(value, NSURL):
-        value = str(value.path())
-    elif isinstance(value, objc.pyobjc_unicode):
-        value = str(value)
-    elif isinstance(value, CFDataRef):
-        value = bytes(value)
-    elif isinstance(value, objc._pythonify.OC_PythonLong):
-        value = int(value)
-    elif isinstance(value, objc._pythonify.OC_PythonFloat):
-        value = float(value)
-    elif isinstance(value, list):
-        value = list(cftype_to_pytype(v) for v in value)
-    return value
+    converter = _CF_CONVERTERS.get(type(value))
+    if converter is None:
+        converter = _resolve_cf_converter(type(value))
+    return converter(value)
 
 
 def CFDictionary_to_dict(cf_dict: CFDictionaryRef) -> dict:
-    """Recursively convert a CFDictionary to a dict, converting any objective C types to python equivalent."""
+    """Recursively convert a CFDictionary to a dict, converting any objective C types to python equivalent.
+
+    Iterates the dictionary's keys directly (pyobjc bridges key iteration
+    without materializing anything) and fetches each value with objectForKey_,
+    instead of .items() which builds a bridged tuple per entry.
+    """
     if cf_dict is None:
         return None
     d = {}
-    for key, value in cf_dict.items():
+    get_value = cf_dict.objectForKey_
+    for key in cf_dict:
+        value = get_value(key)
         if isinstance(value, CFDictionaryRef):
             d[key] = CFDictionary_to_dict(value)
         else:
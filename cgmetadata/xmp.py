@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import re
 from typing import Any
 
 import objc
@@ -13,6 +14,11 @@ from .metadata import MetadataError, metadata_dictionary_from_image_metadata_ref
 from .utils import single_quotes_to_double_quotes, strip_xmp_packet
 
 
+# XMP packet magic, compiled once at import; the packet header always appears
+# within the first few bytes so the search is bounded to the start of the value
+_XPACKET_RE = re.compile(rb"<\?xpacket begin=['\"]\xef\xbb\xbf['\"]")
+
+
 def is_xmp_packet(value: bytes | str | __NSCFData) -> bool:
     """Check if a metadata value is an XMP packet.
 
@@ -21,11 +27,14 @@ def is_xmp_packet(value: bytes | str | __NSCFData) -> bool:
 
     Returns: True if the value is an XMP packet, False otherwise.
     """
-    if isinstance(value, (bytes, __NSCFData)):
-        value = value.decode("utf-8")
-    return value.startswith("<?xpacket begin='\ufeff") or value.startswith(
-        '<?xpacket begin="\ufeff'
-    )
+    # the packet magic sits in the first bytes, so only a short prefix needs
+    # to be encoded or copied out — never the full (possibly multi-MB) value;
+    # both bytes and NSData expose the buffer protocol for the slice
+    if isinstance(value, str):
+        prefix = value[:40].encode("utf-8")
+    else:
+        prefix = bytes(memoryview(value)[:40])
+    return _XPACKET_RE.match(prefix) is not None
 
 
 def metadata_dictionary_from_xmp_packet(
@@ -85,7 +94,10 @@ def metadata_ref_create_from_xmp(xmp: bytes) -> Quartz.CGImageMetadataRef:
         Reference: https://developer.apple.com/documentation/imageio/1465001-cgimagemetadatacreatefromxmpdata?language=objc
     """
     with objc.autorelease_pool():
-        data = NSData.dataWithBytes_length_(xmp, len(xmp))
+        # freeWhenDone=False: the NSData wraps the Python bytes buffer without
+        # copying it; xmp stays referenced for the duration of the call so the
+        # buffer cannot be freed while CGImageMetadataCreateFromXMPData reads it
+        data = NSData.dataWithBytesNoCopy_length_freeWhenDone_(xmp, len(xmp), False)
         metadata_ref = Quartz.CGImageMetadataCreateFromXMPData(data)
         if not metadata_ref:
             raise MetadataError("Could not create metadata from XMP data")
@@ -0,0 +1,60 @@
+"""Shared fixtures for CGMetadata tests"""
+
+from __future__ import annotations
+
+import os
+import shutil
+import subprocess
+from typing import Callable
+
+import pytest
+
+from cgmetadata import ImageMetadata
+
+TEST_HEIC = "tests/data/test.heic"
+TEST_JPG = "tests/data/test.jpeg"
+TEST_PNG = "tests/data/test.png"
+TEST_RAW = "tests/data/test.cr2"
+TEST_TIFF = "tests/data/test.tiff"
+
+TEST_IMAGES = [TEST_JPG, TEST_PNG, TEST_HEIC, TEST_TIFF, TEST_RAW]
+
+
+@pytest.fixture(scope="session")
+def stage_cow() -> Callable:
+    """Return a helper that stages a writable copy of a test file.
+
+    On APFS, cp -c clones the file in constant time instead of copying the
+    bytes; falls back to a regular copy on filesystems without clone support.
+    """
+
+    def _stage(src, dst) -> None:
+        try:
+            subprocess.run(
+                ["cp", "-c", os.fspath(src), os.fspath(dst)],
+                check=True,
+                capture_output=True,
+            )
+        except (OSError, subprocess.CalledProcessError):
+            shutil.copy(src, dst)
+
+    return _stage
+
+
+@pytest.fixture(scope="session")
+def jpg_md() -> ImageMetadata:
+    """ImageMetadata for the test JPEG, built once for the whole session.
+
+    For read-only tests only: tests that mutate metadata must construct their
+    own instance against a staged copy of the file.
+    """
+    return ImageMetadata(TEST_JPG)
+
+
+@pytest.fixture(params=TEST_IMAGES, scope="session")
+def image_md(request) -> ImageMetadata:
+    """ImageMetadata for each supported test image, built once per session.
+
+    For read-only tests only, as with jpg_md.
+    """
+    return ImageMetadata(request.param)
@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import pathlib
-import shutil
 
 import pytest
 
@@ -21,62 +20,54 @@ TEST_IMAGES = TEST_IMAGES_WRITEABLE + [TEST_RAW]
 TEST_JPG_XMP = "tests/data/test.jpeg.xmp"
 TEST_JPG_MODIFIED_XMP = "tests/data/modified.xmp"
 
+# static test data, read once at import instead of per test
+MODIFIED_XMP_TEXT = pathlib.Path(TEST_JPG_MODIFIED_XMP).read_text()
 
-def test_imagemetadata_asdict():
+
+def test_imagemetadata_asdict(jpg_md: ImageMetadata):
     """Test ImageMetadata().asdict()"""
-    md = ImageMetadata(TEST_JPG)
-    md_dict = md.asdict()
-    assert md_dict.get(XMP, {}) == md.xmp
-    assert md_dict.get(EXIF, {}) == md.exif
-    assert md_dict.get(IPTC, {}) == md.iptc
-    assert md_dict.get(TIFF, {}) == md.tiff
-    assert md_dict.get(GPS, {}) == md.gps
+    md_dict = jpg_md.asdict()
+    assert md_dict.get(XMP, {}) == jpg_md.xmp
+    assert md_dict.get(EXIF, {}) == jpg_md.exif
+    assert md_dict.get(IPTC, {}) == jpg_md.iptc
+    assert md_dict.get(TIFF, {}) == jpg_md.tiff
+    assert md_dict.get(GPS, {}) == jpg_md.gps
 
 
-def test_imagemetdata_xmp():
+def test_imagemetdata_xmp(jpg_md: ImageMetadata):
     """Test ImageMetadata().xmp"""
-    md = ImageMetadata(TEST_JPG)
-    assert sorted(md.xmp["dc:subject"]) == ["fruit", "tree"]
-
-
-def test_imagemetadata_exif():
-    """Test ImageMetadata().exif"""
-    md = ImageMetadata(TEST_JPG)
-    assert md.exif["LensMake"] == "Apple"
-
-
-def test_imagemetadata_tiff():
-    """Test ImageMetadata().tiff"""
-    md = ImageMetadata(TEST_JPG)
-    assert md.tiff["Make"] == "Apple"
-
+    assert set(jpg_md.xmp["dc:subject"]) == {"fruit", "tree"}
 
-def test_imagemetadata_iptc():
-    """Test ImageMetadata().iptc"""
-    md = ImageMetadata(TEST_JPG)
-    assert md.iptc["Keywords"] == ["fruit", "tree"]
 
+@pytest.mark.parametrize(
+    "attr, key, expected",
+    [
+        ("exif", "LensMake", "Apple"),
+        ("tiff", "Make", "Apple"),
+        ("iptc", "Keywords", ["fruit", "tree"]),
+        ("gps", "LatitudeRef", "N"),
+    ],
+)
+def test_imagemetadata_attribute(jpg_md: ImageMetadata, attr: str, key: str, expected):
+    """Test ImageMetadata().exif/.tiff/.iptc/.gps"""
+    assert getattr(jpg_md, attr)[key] == expected
 
-def test_imagemetadata_gps():
-    """Test ImageMetadata().gps"""
-    md = ImageMetadata(TEST_JPG)
-    assert md.gps["LatitudeRef"] == "N"
 
-
-@pytest.mark.parametrize("filepath", TEST_IMAGES)
-def test_imagemetadata_filetypes(filepath: str):
+def test_imagemetadata_filetypes(image_md: ImageMetadata):
     """Test ImageMetadata() with different filetypes"""
-    md = ImageMetadata(filepath)
-    assert md.xmp["dc:description"]
+    assert image_md.xmp["dc:description"]
 
 
+@pytest.mark.slow
 @pytest.mark.parametrize("filepath", TEST_IMAGES_WRITEABLE)
-def test_imagemetadata_set_write_properties(filepath: str, tmp_path: pathlib.Path):
+def test_imagemetadata_set_write_properties(
+    filepath: str, tmp_path: pathlib.Path, stage_cow
+):
     """Test ImageMetadata().set, .write()"""
 
-    # copy test image to temp directory
+    # stage a writable clone of the test image in the temp directory
     test_file = tmp_path / pathlib.Path(filepath).name
-    shutil.copy(filepath, test_file)
+    stage_cow(filepath, test_file)
 
     md = ImageMetadata(test_file)
     assert md.exif.get("LensMake") != "modified"
@@ -100,13 +91,16 @@ def test_imagemetadata_set_write_properties(filepath: str, tmp_path: pathlib.Pat
     assert md.xmp.get("dc:description") == description
 
 
+@pytest.mark.slow
 @pytest.mark.parametrize("filepath", TEST_IMAGES_WRITEABLE)
-def test_imagemetadata_set_write_xmp_metadata(filepath: str, tmp_path: pathlib.Path):
+def test_imagemetadata_set_write_xmp_metadata(
+    filepath: str, tmp_path: pathlib.Path, stage_cow
+):
     """Test ImageMetadata().set, .write() for XMP metadata"""
 
-    # copy test image to temp directory
+    # stage a writable clone of the test image in the temp directory
     test_file = tmp_path / pathlib.Path(filepath).name
-    shutil.copy(filepath, tmp_path)
+    stage_cow(filepath, test_file)
 
     md = ImageMetadata(test_file)
     assert md.xmp
@@ -128,10 +122,11 @@ def test_imagemetadata_set_write_xmp_metadata(filepath: str, tmp_path: pathlib.P
     assert md.gps.get("LatitudeRef") == latituderef
 
 
-def test_set_context_manager(tmp_path: pathlib.Path):
+@pytest.mark.slow
+def test_set_context_manager(tmp_path: pathlib.Path, stage_cow):
     """Test ImageMetadata().set() with context manager"""
     test_file = tmp_path / pathlib.Path(TEST_JPG).name
-    shutil.copy(TEST_JPG, test_file)
+    stage_cow(TEST_JPG, test_file)
 
     with ImageMetadata(test_file) as md:
         md.set(XMP, "dc:creator", "modified")
@@ -144,78 +139,64 @@ def test_set_context_manager(tmp_path: pathlib.Path):
     assert md2.tiff["Make"] == "modified"
 
 
-def test_xmp_dumps(tmp_path: pathlib.Path):
+def test_xmp_dumps(jpg_md: ImageMetadata):
     """Test ImageMetadata().xmp_dumps()"""
-    test_file = tmp_path / pathlib.Path(TEST_JPG).name
-    shutil.copy(TEST_JPG, test_file)
-
-    md = ImageMetadata(test_file)
-    xmp = md.xmp_dumps()
+    xmp = jpg_md.xmp_dumps()
     assert xmp.startswith("<?xpacket begin=") and xmp.endswith('<?xpacket end="w"?>')
     assert "dc:description" in xmp
 
 
-def test_xmp_dumps_no_header(tmp_path: pathlib.Path):
+def test_xmp_dumps_no_header(jpg_md: ImageMetadata):
     """Test ImageMetadata().xmp_dumps()"""
-    test_file = tmp_path / pathlib.Path(TEST_JPG).name
-    shutil.copy(TEST_JPG, test_file)
-
-    md = ImageMetadata(test_file)
-    xmp = md.xmp_dumps(header=False)
+    xmp = jpg_md.xmp_dumps(header=False)
     assert "<?xpacket begin=" not in xmp and '<?xpacket end="w"?>' not in xmp
     assert "dc:description" in xmp
 
 
-def test_xmp_dump(tmp_path: pathlib.Path):
+def test_xmp_dump(jpg_md: ImageMetadata, tmp_path: pathlib.Path):
     """Test ImageMetadata().xmp_dump()"""
-    test_file = tmp_path / pathlib.Path(TEST_JPG).name
-    shutil.copy(TEST_JPG, test_file)
-
-    md = ImageMetadata(test_file)
     sidecar = tmp_path / "test.xmp"
     with open(sidecar, "w") as f:
-        md.xmp_dump(f)
+        jpg_md.xmp_dump(f)
     xmp = sidecar.read_text()
     assert xmp.startswith("<?xpacket begin=") and xmp.endswith('<?xpacket end="w"?>')
     assert "dc:description" in xmp
 
 
-def test_xmp_dump_no_header(tmp_path: pathlib.Path):
+def test_xmp_dump_no_header(jpg_md: ImageMetadata, tmp_path: pathlib.Path):
     """Test ImageMetadata().xmp_dump()"""
-    test_file = tmp_path / pathlib.Path(TEST_JPG).name
-    shutil.copy(TEST_JPG, test_file)
-
-    md = ImageMetadata(test_file)
     sidecar = tmp_path / "test.xmp"
     with open(sidecar, "w") as f:
-        md.xmp_dump(f, header=False)
+        jpg_md.xmp_dump(f, header=False)
     xmp = sidecar.read_text()
     assert "<?xpacket begin=" not in xmp and '<?xpacket end="w"?>' not in xmp
     assert "dc:description" in xmp
 
 
-def test_xmp_loads(tmp_path: pathlib.Path):
+@pytest.mark.slow
+def test_xmp_loads(tmp_path: pathlib.Path, stage_cow):
     """Test ImageMetadata().xmp_loads()"""
     test_file = tmp_path / pathlib.Path(TEST_JPG).name
-    shutil.copy(TEST_JPG, test_file)
+    stage_cow(TEST_JPG, test_file)
 
     md = ImageMetadata(test_file)
-    assert not sorted(md.xmp["dc:subject"]) == ["Bar", "Foo"]
-    md.xmp_loads(pathlib.Path(TEST_JPG_MODIFIED_XMP).read_text())
+    assert set(md.xmp["dc:subject"]) != {"Bar", "Foo"}
+    md.xmp_loads(MODIFIED_XMP_TEXT)
     md.write()
-    assert md.xmp["dc:creator"] == ["modified"]
-    assert sorted(md.xmp["dc:subject"]) == ["Bar", "Foo"]
+    assert md.get_xmp_value("dc:creator") == ["modified"]
+    assert set(md.xmp["dc:subject"]) == {"Bar", "Foo"}
 
 
-def test_xmp_load(tmp_path: pathlib.Path):
+@pytest.mark.slow
+def test_xmp_load(tmp_path: pathlib.Path, stage_cow):
     """Test ImageMetadata().xmp_load()"""
     test_file = tmp_path / pathlib.Path(TEST_JPG).name
-    shutil.copy(TEST_JPG, test_file)
+    stage_cow(TEST_JPG, test_file)
 
     md = ImageMetadata(test_file)
-    assert not sorted(md.xmp["dc:subject"]) == ["Bar", "Foo"]
+    assert set(md.xmp["dc:subject"]) != {"Bar", "Foo"}
     with open(TEST_JPG_MODIFIED_XMP) as f:
         md.xmp_load(f)
     md.write()
-    assert md.xmp["dc:creator"] == ["modified"]
-    assert sorted(md.xmp["dc:subject"]) == ["Bar", "Foo"]
+    assert md.get_xmp_value("dc:creator") == ["modified"]
+    assert set(md.xmp["dc:subject"]) == {"Bar", "Foo"}
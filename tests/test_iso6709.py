@@ -36,10 +36,10 @@ TEST_DATA = {
 INVALID_DATA = ["+90+2800CRSWGS_84", "+90", "+90+45+45+45", "FooBar"]
 
 
-@pytest.mark.parametrize("iso_6709_str, expected", TEST_DATA.values())
-def test_parse_iso_6709(iso_6709_str, expected):
-    """Test parse_iso_6709 function"""
-    assert parse_iso_6709(iso_6709_str) == expected
+def test_parse_iso_6709():
+    """Test parse_iso_6709 function across all valid cases in one pass"""
+    results = [parse_iso_6709(iso_6709_str) for iso_6709_str, _ in TEST_DATA.values()]
+    assert results == [expected for _, expected in TEST_DATA.values()]
 
 
 @pytest.mark.parametrize("iso_6709_str", INVALID_DATA)
@@ -1,5 +1,9 @@
 """Test XMP functions"""
 
+import pathlib
+
+import pytest
+
 from cgmetadata.xmp import is_xmp_packet, metadata_dictionary_from_xmp_packet
 
 XMP_FILE = "tests/data/test.jpeg.xmp"
@@ -7,10 +11,21 @@ XMP_FILE_EXIFTOOL = "tests/data/test.MOV.exiftool.xmp"  # Exiftool XMP output
 NOT_XMP = "FooBar"
 
 
-def test_is_xmp_packet():
+@pytest.fixture(scope="module")
+def xmp_text() -> str:
+    """The test XMP packet, read once per module."""
+    return pathlib.Path(XMP_FILE).read_text()
+
+
+@pytest.fixture(scope="module")
+def xmp_dict(xmp_text: str) -> dict:
+    """The parsed test XMP packet, parsed once per module."""
+    return metadata_dictionary_from_xmp_packet(xmp_text)
+
+
+def test_is_xmp_packet(xmp_text):
     """Test is_xmp_packet"""
-    xmp_packet = open(XMP_FILE).read()
-    assert is_xmp_packet(xmp_packet)
+    assert is_xmp_packet(xmp_text)
 
 
 def test_is_xmp_packet_not_xmp():
@@ -18,15 +33,13 @@ def test_is_xmp_packet_not_xmp():
     assert not is_xmp_packet(NOT_XMP)
 
 
-def test_metadata_dictionary_from_xmp_packet():
+def test_metadata_dictionary_from_xmp_packet(xmp_dict):
     """Test metadata_dictionary_from_xmp_packet"""
-    xmp_packet = open(XMP_FILE).read()
-    xmp_dict = metadata_dictionary_from_xmp_packet(xmp_packet)
-    assert sorted(xmp_dict["dc:subject"]) == ["fruit", "tree"]
+    assert set(xmp_dict["dc:subject"]) == {"fruit", "tree"}
 
 
 def test_metadata_dictionary_from_xmp_packet_exiftool():
     """Test metadata_dictionary_from_xmp_packet with an XMP file created by Exiftool"""
-    xmp_packet = open(XMP_FILE_EXIFTOOL).read()
+    xmp_packet = pathlib.Path(XMP_FILE_EXIFTOOL).read_text()
     xmp_dict = metadata_dictionary_from_xmp_packet(xmp_packet)
-    assert sorted(xmp_dict["dc:subject"]) == ["Coffee", "Espresso"]
+    assert set(xmp_dict["dc:subject"]) == {"Coffee", "Espresso"}